@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import codecs
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+benchdir = os.path.dirname(os.path.realpath(__file__))
+root = os.path.dirname(benchdir)
+sys.path.insert(0, os.path.join(root, "_py"))
+import pso2es  # noqa: E402
+
+# Time every tool over a json folder and keep its peak memory.
+#
+#   ./_bench/bench.py <jsondir> [results.json] [command...]
+#   ./_bench/bench.py compare <baseline.json> <results.json> [percent]
+#
+# Make the json folders with corpus.py. Every command runs over a fresh
+# copy of the folder, as the tools write to it. compare fails when a command
+# got more than percent (10 by default) slower than in the baseline.
+
+# Need things that are not in a json folder, or never exit
+skip = {
+    "import": "needs a CSV file",
+    "serve": "keeps running",
+    "watch": "keeps running",
+    "staged": "needs staged files",
+    "search": "needs a query",
+    "undo": "needs a run to undo",
+}
+
+tolerance = 10
+
+
+def names(wanted=None):
+    return [
+        n for n in pso2es.commands
+        if n not in skip and (not wanted or n in wanted)
+    ]
+
+
+def run(name, src):
+    """Run one command over a copy of src, return (seconds, peak KB, exit code)."""
+    script, cwd, desc = pso2es.commands[name]
+    with tempfile.TemporaryDirectory() as tmp:
+        # The _tools scripts look for ../json, the others get the folder
+        shutil.copytree(src, os.path.join(tmp, "json"))
+        os.mkdir(os.path.join(tmp, "_tools"))
+        cmd = [sys.executable, os.path.join(root, script)]
+        if cwd == "tools":
+            cwd = os.path.join(tmp, "_tools")
+        else:
+            cwd = tmp
+            cmd.append("json")
+        s = time.perf_counter()
+        p = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if hasattr(os, "wait4"):
+            pid, status, usage = os.wait4(p.pid, 0)
+            e = time.perf_counter() - s
+            # Bytes on macOS, KB everywhere else
+            peak = usage.ru_maxrss
+            if platform.system() == "Darwin":
+                peak //= 1024
+            p.returncode = os.waitstatus_to_exitcode(status) if hasattr(os, "waitstatus_to_exitcode") else status >> 8
+        else:
+            p.wait()
+            e = time.perf_counter() - s
+            peak = None
+    return e, peak, p.returncode
+
+
+def bench(src, wanted=None):
+    results = dict()
+    for name in names(wanted):
+        e, peak, code = run(name, src)
+        results[name] = {"seconds": round(e, 3), "peak_kb": peak, "exit": code}
+        print("{:<20}{:>9.2f} s{:>10} KB{:>5}".format(name, e, peak if peak is not None else "-", code))
+        sys.stdout.flush()
+    for name in sorted(skip):
+        print("{:<20}skipped, {}".format(name, skip[name]))
+    return {
+        "corpus": os.path.abspath(src),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(baseline, results, percent=tolerance):
+    """Print the commands slower than baseline by more than percent, return how many."""
+    slower = 0
+    for name, r in sorted(results["results"].items()):
+        b = baseline["results"].get(name)
+        if b is None:
+            continue
+        change = (r["seconds"] - b["seconds"]) * 100 / max(b["seconds"], 0.001)
+        mark = ""
+        if change > percent:
+            mark = "  SLOWER"
+            slower += 1
+        print("{:<20}{:>9.2f} s{:>9.2f} s{:>+8.1f}%{}".format(name, b["seconds"], r["seconds"], change, mark))
+    return slower
+
+
+def load(filename):
+    with codecs.open(filename, mode='r', encoding='utf-8') as json_file:
+        return json.load(json_file)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        sys.exit("usage: {} <jsondir> [results.json] [command...]\n"
+                 "       {} compare <baseline.json> <results.json> [percent]".format(sys.argv[0], sys.argv[0]))
+
+    if sys.argv[1] == "compare":
+        percent = tolerance
+        if len(sys.argv) > 4:
+            percent = float(sys.argv[4])
+        if compare(load(sys.argv[2]), load(sys.argv[3]), percent) > 0:
+            sys.exit("Slower than the baseline")
+        sys.exit(0)
+
+    results = bench(sys.argv[1], sys.argv[3:])
+    if len(sys.argv) > 2:
+        with codecs.open(sys.argv[2], mode='w+', encoding='utf-8') as json_file:
+            json.dump(results, json_file, ensure_ascii=False, indent="\t", sort_keys=False)
+            json_file.write("\n")
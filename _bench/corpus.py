@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import codecs
+import hashlib
+import json
+import os
+import random
+import shutil
+import sys
+
+# Build a bigger json folder out of the real one, to see how the tools scale.
+#
+#   ./_bench/corpus.py <scale> <dest> [jsondir]
+#
+# Every file keeps its name and gets its entries <scale> times. The first
+# copy is the real text, the others are scrambled: every letter, digit, kana
+# and kanji is swapped for another of the same kind, so the lengths, the
+# line breaks, the <markup> and the mix of English and Japanese stay the
+# same. The same string is scrambled the same way everywhere in a copy, so
+# the duplicates between files stay duplicates.
+
+# Left in every folder made here, holds the scale
+marker = ".corpus"
+
+# Fields that have to stay unique in a file
+ids = ("assign", "title_id", "text_id", "id", "eventNo")
+
+ranges = [
+    ("a", "z"),
+    ("A", "Z"),
+    ("0", "9"),
+    ("ぁ", "ゖ"),  # Hiragana
+    ("ァ", "ヺ"),  # Katakana
+    ("一", "鿿"),  # Kanji
+    ("Ａ", "Ｚ"),  # Full width A-Z
+    ("ａ", "ｚ"),  # Full width a-z
+]
+ranges = [(ord(s), ord(e)) for s, e in ranges]
+
+
+def kind(c):
+    o = ord(c)
+    for s, e in ranges:
+        if s <= o <= e:
+            return s, e
+    return None
+
+
+def scramble(text, copy):
+    if text == "":
+        return text
+    seed = hashlib.md5("{}:{}".format(copy, text).encode("utf-8")).digest()
+    rng = random.Random(seed)
+    out = list()
+    tag = False
+    for c in text:
+        if c == "<":
+            tag = True
+        elif c == ">":
+            tag = False
+        r = None if tag else kind(c)
+        if r is None:
+            out.append(c)
+        else:
+            out.append(chr(rng.randint(*r)))
+    return "".join(out)
+
+
+def unique(value, copy):
+    if isinstance(value, int):
+        return value + copy * 10000000
+    return "{}_{}".format(value, copy)
+
+
+def entry(e, copy):
+    if copy == 0:
+        return e
+    new = dict()
+    for k, v in e.items():
+        if k in ids:
+            new[k] = unique(v, copy)
+        elif k.startswith(("tr_", "jp_")) or k == "text":
+            if isinstance(v, list):
+                new[k] = [scramble(t, copy) if isinstance(t, str) else t for t in v]
+            elif isinstance(v, str):
+                new[k] = scramble(v, copy)
+            else:
+                new[k] = v
+        else:
+            new[k] = v
+    return new
+
+
+def build(src, dest, scale):
+    """Write every file of src to dest with its entries scale times."""
+    if os.path.exists(dest):
+        # Only ever replace a folder this script made
+        if os.listdir(dest) and not os.path.exists(os.path.join(dest, marker)):
+            raise ValueError("{} is not empty and was not made by corpus.py".format(dest))
+        shutil.rmtree(dest)
+    os.makedirs(dest)
+    with open(os.path.join(dest, marker), "w") as m:
+        m.write("{}\n".format(scale))
+    total = 0
+    for f in sorted(os.listdir(src)):
+        path = os.path.join(src, f)
+        if not f.endswith(".txt"):
+            if os.path.isfile(path):
+                shutil.copy(path, dest)
+            continue
+        with codecs.open(path, mode='r', encoding='utf-8') as json_file:
+            djson = json.load(json_file)
+        out = list()
+        for copy in range(scale):
+            out.extend(entry(e, copy) for e in djson)
+        with codecs.open(os.path.join(dest, f), mode='w+', encoding='utf-8') as json_file:
+            json.dump(
+                out, json_file, ensure_ascii=False,
+                indent="\t", sort_keys=False)
+            json_file.write("\n")
+        total += len(out)
+    return total
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        sys.exit("usage: {} <scale> <dest> [jsondir]".format(sys.argv[0]))
+    scale = int(sys.argv[1])
+    dest = sys.argv[2]
+    if len(sys.argv) < 4:
+        src = "json"
+    else:
+        src = sys.argv[3]
+    try:
+        total = build(src, dest, scale)
+    except ValueError as e:
+        sys.exit(str(e))
+    print("Wrote {} entries to {}".format(total, dest))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import json
+import os
+import sys
+import time
+
+benchdir = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(benchdir), "_py"))
+import _jsonio  # noqa: E402
+
+# Check that _jsonio reads and writes every file of a json folder as the
+# json module does, the written ones byte for byte the same as the file,
+# and time both.
+#
+#   ./_bench/jsonio.py [jsondir]
+
+
+def timed(func, *args, **kwargs):
+    s = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - s, result
+
+
+if __name__ == '__main__':
+    dir = sys.argv[1] if len(sys.argv) > 1 else "json"
+    print("backend: {}".format(_jsonio.backend))
+    parse = [0.0, 0.0]
+    write = [0.0, 0.0]
+    differ = 0
+    files = 0
+    for f in sorted(os.listdir(dir)):
+        if not f.endswith(".txt"):
+            continue
+        with open(os.path.join(dir, f), mode='rb') as json_file:
+            raw = json_file.read()
+        try:
+            t, a = timed(json.loads, raw.decode("utf-8"))
+        except ValueError:
+            continue
+        files += 1
+        parse[0] += t
+        t, b = timed(_jsonio.loads, raw)
+        parse[1] += t
+        if a != b:
+            print("{}: read differently".format(f))
+            differ += 1
+            continue
+        t, c = timed(json.dumps, a, ensure_ascii=False, indent="\t", sort_keys=False)
+        write[0] += t
+        t, d = timed(_jsonio.dumps, b)
+        write[1] += t
+        if c != d:
+            print("{}: written differently".format(f))
+            differ += 1
+        elif (d + "\n").encode("utf-8") != raw:
+            print("{}: not as it is on disk".format(f))
+    print("{} files".format(files))
+    print("parse  json {:>7.3f} s  _jsonio {:>7.3f} s".format(*parse))
+    print("dump   json {:>7.3f} s  _jsonio {:>7.3f} s".format(*write))
+    if differ:
+        sys.exit("{} files differ".format(differ))
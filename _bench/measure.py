@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import codecs
+import json
+import os
+import sys
+import time
+
+benchdir = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(benchdir), "_py"))
+import _checker  # noqa: E402
+import _fonts  # noqa: E402
+
+# Time textlength() one string at a time against measure_batch(), over the
+# translated texts of a json folder, and make sure they agree.
+#
+#   ./_bench/measure.py [jsondir] [count=100000] [scale=4]
+
+
+def corpus(dir, count):
+    names = list()
+    for f in sorted(os.listdir(dir)):
+        if not f.endswith(".txt"):
+            continue
+        with codecs.open(os.path.join(dir, f), mode='r', encoding='utf-8') as json_file:
+            djson = json.load(json_file)
+        for entry in djson:
+            for k, v in entry.items():
+                if not k.startswith("tr_"):
+                    continue
+                for t in (v if isinstance(v, list) else [v]):
+                    if isinstance(t, str) and t != "":
+                        names.append(_checker.remove_html_markup(t))
+    # Repeat the corpus if it is too small
+    while names and len(names) < count:
+        names.extend(names[:count - len(names)])
+    return names[:count]
+
+
+if __name__ == '__main__':
+    dir = sys.argv[1] if len(sys.argv) > 1 else "json"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    scale = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    _fonts.init(scale)
+    names = corpus(dir, count)
+    print("{} strings, batched: {}".format(len(names), _fonts.batched()))
+
+    s = time.perf_counter()
+    batch = _fonts.measure_batch(names, "d")
+    print("measure_batch, new glyphs {:>9.3f} s".format(time.perf_counter() - s))
+    s = time.perf_counter()
+    batch = _fonts.measure_batch(names, "d")
+    print("measure_batch             {:>9.3f} s".format(time.perf_counter() - s))
+
+    _fonts.cache.clear()
+    s = time.perf_counter()
+    one = [_fonts.textlength(n) for n in names]
+    print("textlength                {:>9.3f} s".format(time.perf_counter() - s))
+
+    differ = sum(1 for a, b in zip(batch, one) if a != b)
+    if differ:
+        sys.exit("{} widths differ".format(differ))
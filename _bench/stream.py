@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import codecs
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+benchdir = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(benchdir), "_py"))
+import _stream  # noqa: E402
+
+# Time json.load against reading only some fields with _stream, with the
+# peak memory of both, over the biggest files of a json folder, and make
+# sure they agree.
+#
+#   ./_bench/stream.py [jsondir] [count=5] [field...]
+#
+# The fields are tr_text and jp_text by default.
+
+
+def full(filename, fields):
+    with codecs.open(filename, mode='r', encoding='utf-8') as json_file:
+        djson = json.load(json_file)
+    return [tuple(entry.get(field) for field in fields) for entry in djson]
+
+
+def projected(filename, fields):
+    return list(_stream.project(filename, fields))
+
+
+def run(func, filename, fields):
+    """Return (seconds, peak KB, result) of the quickest of 5 runs."""
+    best = None
+    for n in range(5):
+        s = time.perf_counter()
+        result = func(filename, fields)
+        took = time.perf_counter() - s
+        best = took if best is None else min(best, took)
+    tracemalloc.start()
+    func(filename, fields)
+    peak = tracemalloc.get_traced_memory()[1] // 1024
+    tracemalloc.stop()
+    return best, peak, result
+
+
+if __name__ == '__main__':
+    dir = sys.argv[1] if len(sys.argv) > 1 else "json"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    fields = sys.argv[3:] or ["tr_text", "jp_text"]
+    filenames = sorted(
+        (os.path.join(dir, f) for f in os.listdir(dir) if f.endswith(".txt")),
+        key=lambda f: -os.path.getsize(f))[:count]
+
+    differ = 0
+    print("{:<36} {:>8} {:>18} {:>18}".format("file", "KB", "json.load s/KB", "_stream s/KB"))
+    for filename in filenames:
+        ft, fm, a = run(full, filename, fields)
+        pt, pm, b = run(projected, filename, fields)
+        print("{:<36} {:>8} {:>9.3f} {:>8} {:>9.3f} {:>8}".format(
+            os.path.basename(filename), os.path.getsize(filename) // 1024, ft, fm, pt, pm))
+        if a != b:
+            print("  the entries differ")
+            differ += 1
+    if differ:
+        sys.exit("{} files differ".format(differ))
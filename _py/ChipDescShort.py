@@ -1,79 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import _fonts
-import codecs
-from collections import OrderedDict
-import fnmatch
-import json
-import os
+import _checker
 import sys
 
-# Error counter
-counterr = 0
-
-# Need the json path
-if len(sys.argv) < 2:
-    dir = "json"
-else:
-    dir = sys.argv[1]
-
-FS = dict()
-
-chip_files = [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'ChipExplain_*.txt')
-]
-
-if len(sys.argv) == 3 and sys.argv[2] != "0":
-    _fonts.init(int(sys.argv[2]))
-else:
-    _fonts.init()
-
-
-def remove_html_markup(s):
-    tag = False
-    quote = False
-    out = ""
-
-    for c in s:
-            if c == '<' and not quote:
-                tag = True
-            elif c == '>' and not quote:
-                tag = False
-            elif (c == '"' or c == "'") and tag:
-                quote = not quote
-            elif not tag:
-                out = out + c
-    return out
-
-
-for files in chip_files:
-    with codecs.open(files, mode='r', encoding='utf-8') as json_file:
-        djson = json.load(json_file)
-        for entry in djson:
-            t = entry["tr_explainShort"]
-            j = entry["jp_explainShort"]
-            if t == "" or j == t:
-                continue
-            c = remove_html_markup(t)
-            if (t in FS):
-                continue
-            FS[t] = _fonts.textlength(c)
-
-FSk = OrderedDict(sorted(FS.items(), key=lambda t: t[0]))
-FSs = OrderedDict(sorted(FSk.items(), key=lambda t: t[1]))
-
-if len(sys.argv) == 3:
-    print(json.dumps(FSs, ensure_ascii=False, indent="\t", sort_keys=False))
-else:  # JP MAX: 36.79
-    FSEP = OrderedDict((key, value) for key, value in FSs.items() if value > 21.5)
-    for e, s in FSEP.items():
-        counterr += 1
-        print("Chip Short explain '{}' is too big: {}".format(e, s))
-
-# Disable error
-# counterr = -counterr
-
-if counterr > 0:
-    sys.exit("Issues found")
+# The limits are in _limits.py
+if __name__ == '__main__':
+    sys.exit(_checker.main(["ChipDescShort"]))
@@ -1,111 +1,55 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import _checker
 import _fonts
-import codecs
+import _jsonio
+import _limits
+import _manifest
+import _report
+import _stats
 from collections import OrderedDict
-import fnmatch
-import json
 import multiprocessing as mp
 import os
 import platform
 import sys
 
-linelimit = 17.7
-
-
-def word_wrap(string, width=00.00):
-    words = string.replace(" \n", " ").replace("\n", " ").split(" ")
-    newstrings = []
-    current = ""
-    wordi = 0
-
-    while True:
-        current = ""
-        lastgood = ""
-
-        if len(words) == wordi:
-            break
-
-        while len(words) > wordi:
-            current = current
-
-            if (current == ""):
-                current += words[wordi]
-            else:
-                current += " " + words[wordi]
-
-            if (_fonts.textlength(remove_html_markup(current)) >= width):
-                break
-
-            lastgood = current
-            wordi += 1
-
-        if (lastgood == "" and len(words) > wordi):
-            lastgood = words[wordi]
-            wordi += 1
-
-        if (lastgood != ""):
-            newstrings.append(lastgood)
-
-    warped = "\n".join(newstrings)
-
-    return warped
-
-
-def remove_html_markup(s):
-    tag = False
-    quote = False
-    out = ""
-
-    for c in s:
-        if c == '<' and not quote:
-            tag = True
-        elif c == '>' and not quote:
-            tag = False
-        elif (c == '"' or c == "'") and tag:
-            quote = not quote
-        elif not tag:
-            out = out + c
-    return out
-
-
-def check(filename):
-    f = os.path.splitext(os.path.basename(filename))[0]
-    with codecs.open(filename, mode='r', encoding='utf-8') as json_file:
-        djson = json.load(json_file)
-        update = False
-        for entry in djson:
-            tt = entry["tr_text"]
-            jt = entry["jp_text"]
-            te = entry["tr_explain"]
-            je = entry["jp_explain"]
-            if tt == "":
-                t = jt
-            else:
-                t = tt
-            if te == "" or je == te:
-                continue
-            ce = remove_html_markup(te)
-            fc = "{}:{}:{}".format(f, t, ce)
-            FS[fc] = _fonts.textlength(ce)
-            if (FS[fc] >= linelimit):
-                ww = word_wrap(te, linelimit)
-                FS[fc] = 0
-                ce = remove_html_markup(ww)
-                fc = "{}:{}:{}".format(f, t, ce)
-                FS[fc] = _fonts.textlength(ce)
-                entry["tr_explain"] = ww
-                update = True
-
-        if (update):
-            print("Updating {}".format(filename))
-            with codecs.open(filename, mode='w+', encoding='utf-8') as json_file:
-                json.dump(
-                    djson, json_file, ensure_ascii=False,
-                    indent="\t", sort_keys=False)
-                json_file.write("\n")
-            return 1
-    return 0
+linelimit = _limits.limit("ItemDescFont")
+
+
+def check(job):
+    filename, part, parts = job
+    djson = _checker.load(filename)
+    start, stop = _checker.bounds(len(djson), part, parts)
+    update = list()
+    found = _checker.Found()
+    for index in range(start, stop):
+        entry = djson[index]
+        te = entry["tr_explain"]
+        je = entry["jp_explain"]
+        if te == "" or je == te:
+            continue
+        width = _fonts.textlength(_checker.remove_html_markup(te))
+        if (width >= linelimit):
+            ww = _checker.word_wrap(te, linelimit)
+            width = _fonts.textlength(_checker.remove_html_markup(ww))
+            update.append((index, ww))
+        found.add(0, index, -1, width)
+    return update, found
+
+
+def name(f, entry, explain):
+    t = entry["tr_text"]
+    if t == "":
+        t = entry["jp_text"]
+    return "{}:{}:{}".format(f, t, _checker.remove_html_markup(explain))
+
+
+def write(filename, djson, update):
+    print("Updating {}".format(filename))
+    for index, ww in update.items():
+        djson[index]["tr_explain"] = ww
+    with _stats.phase("write"):
+        _jsonio.write(filename, djson)
 
 
 if __name__ == '__main__':
@@ -119,44 +63,9 @@ if __name__ == '__main__':
     else:
         dir = sys.argv[1]
 
-    manager = mp.Manager()
-    FS = manager.dict()
-
-    items_files = [
-        os.path.join(dirpath, f)
-        for dirpath, dirnames, files in os.walk(dir)
-        for f in fnmatch.filter(files, 'Item_*.txt')
-    ]
-
-    items_files += [
-        os.path.join(dirpath, f)
-        for dirpath, dirnames, files in os.walk(dir)
-        for f in fnmatch.filter(files, 'Explain_Actor_Mag*.txt')
-    ]
-
-    items_files += [
-        os.path.join(dirpath, f)
-        for dirpath, dirnames, files in os.walk(dir)
-        for f in fnmatch.filter(files, 'Explain_Actor_StackDeviceSAA.txt')
-    ]
-
-    items_files += [
-        os.path.join(dirpath, f)
-        for dirpath, dirnames, files in os.walk(dir)
-        for f in fnmatch.filter(files, 'Explain_SkillRing.txt')
-    ]
-
-    items_files += [
-        os.path.join(dirpath, f)
-        for dirpath, dirnames, files in os.walk(dir)
-        for f in fnmatch.filter(files, 'Explain_System.txt')
-    ]
-
-    items_files += [
-        os.path.join(dirpath, f)
-        for dirpath, dirnames, files in os.walk(dir)
-        for f in fnmatch.filter(files, 'Items_Leftovers.txt')
-    ]
+    FS = dict()
+
+    items_files = _manifest.files(dir, "item_desc")
 
     if len(sys.argv) == 3 and sys.argv[2] != "0":
         _fonts.init(int(sys.argv[2]))
@@ -165,28 +74,41 @@ if __name__ == '__main__':
     else:
         _fonts.init()
 
-    if platform.system() == 'Windows':
-        for f in items_files:
-            erra = 0
-            try:
-                erra += check(f)
-            except Exception as ex:
-                print("Error in {}: {}".format(f, ex))
-    else:
-        p = mp.Pool(mp.cpu_count())
-        erra = p.map(check, items_files)
-        p.close()
-        p.join()
-        counterr = max(erra)
-
-    FSk = OrderedDict(sorted(FS.items(), key=lambda t: t[0]))
-    FSs = OrderedDict(sorted(FSk.items(), key=lambda t: t[1]))
+    # Split the big files so they do not hold up the run
+    jobs = _checker.plan(items_files, os.cpu_count() or 1)
+    results = OrderedDict((filename, list()) for filename in items_files)
+    for job, result in zip(jobs, _checker.schedule(check, jobs)):
+        results[job[0]].append(result)
+
+    # The workers only send back numbers, the names are made here for the
+    # descriptions that get reported, or for all of them when dumping
+    for filename, result in results.items():
+        update = dict()
+        for u, found in result:
+            update.update(u)
+        values = [(e, width) for u, found in result for r, e, k, width, n, room in found]
+        if len(sys.argv) != 3:
+            values = [(e, width) for e, width in values if width > linelimit]
+        if not update and not values:
+            continue
+        f = os.path.splitext(os.path.basename(filename))[0]
+        djson = _checker.load(filename)
+        for e, width in sorted(values):
+            entry = djson[e]
+            if e in update:
+                if len(sys.argv) == 3:
+                    FS[name(f, entry, entry["tr_explain"])] = 0
+                FS[name(f, entry, update[e])] = width
+            else:
+                FS[name(f, entry, entry["tr_explain"])] = width
+        if update:
+            write(filename, djson, update)
+            counterr = 1
 
     if len(sys.argv) == 3:
-        print(json.dumps(FSs, ensure_ascii=False, indent="\t", sort_keys=False))
+        _report.dump(FS)
     else:  # JP MAX: 42.73
-        FSEP = OrderedDict((key, value) for key, value in FSs.items() if (value > linelimit))
-        for e, s in FSEP.items():  # MAX: 32
+        for e, s in _report.over(FS, linelimit):  # MAX: 32
             t = e.replace("\n", "\\n")
             print("Item Desc '{}' is too long: {}".format(t, s))
 
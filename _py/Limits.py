@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _checker
+import sys
+
+# Check every rule in _limits.py, reading each file only once
+if __name__ == '__main__':
+    sys.exit(_checker.main())
@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _fonts
+import _jsonio
+import _limits
+import _manifest
+import _report
+import _stats
+from array import array
+from collections import OrderedDict
+import os
+import platform
+import sys
+
+# The rules being checked, which of them cover each file and the texts of
+# the only/unless groups, set by main() before the workers start
+rules = list()
+which = dict()
+groups = dict()
+
+
+class Found(object):
+    """The measurements of one job, in parallel arrays.
+
+    Only numbers go back from the workers: the rule, the entry and the list
+    item (-1 for plain strings) a value belongs to. The texts are looked up
+    again for the few measurements that get reported.
+    """
+    __slots__ = ("rule", "entry", "item", "value", "lines", "room")
+
+    def __init__(self):
+        self.rule = array("H")
+        self.entry = array("L")
+        self.item = array("l")
+        self.value = array("d")
+        self.lines = array("H")
+        self.room = array("H")
+
+    def add(self, rule, entry, item, value, lines=0, room=0):
+        self.rule.append(rule)
+        self.entry.append(entry)
+        self.item.append(item)
+        self.value.append(value)
+        self.lines.append(lines)
+        self.room.append(room)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __iter__(self):
+        return zip(self.rule, self.entry, self.item, self.value, self.lines, self.room)
+
+
+def remove_html_markup(s):
+    tag = False
+    quote = False
+    out = ""
+
+    for c in s:
+        if c == '<' and not quote:
+            tag = True
+        elif c == '>' and not quote:
+            tag = False
+        elif (c == '"' or c == "'") and tag:
+            quote = not quote
+        elif not tag:
+            out = out + c
+    return out
+
+
+def lines(text):
+    t = text.replace("<%br>", "\n").replace("<br>", "\n").replace("\\n", "\n").rstrip()
+    return t.splitlines()
+
+
+def shown(rule, text):
+    """Return the part of the text the rule measures."""
+    if "cut" in rule:
+        text = text.rstrip().split(rule["cut"])[0]
+    if rule["measure"] == "font" and rule.get("markup"):
+        with _stats.phase("markup"):
+            text = remove_html_markup(text)
+    return text
+
+
+def measure(rule, text):
+    text = shown(rule, text)
+    kind = rule["measure"]
+    if kind == "font":
+        return _fonts.textlength(text)
+    elif kind == "len":
+        return len(text)
+    elif kind == "lines":
+        return len(lines(text))
+    raise ValueError("Unknown measure '{}'".format(kind))
+
+
+def room(rule, jp=None):
+    """The most lines a text can have, 0 for any number.
+
+    A dialogue box takes more lines when its JP text uses more.
+    """
+    if "box" in rule:
+        return max(rule["box"], len(lines(jp or "")))
+    return rule.get("maxlines", 0)
+
+
+def fails(rule, value, toomany=False):
+    """Does a text over the limits fail the check?"""
+    fail = rule.get("fail", rule["limit"])
+    if fail is None:
+        return False
+    if toomany:
+        return "box" not in rule or rule.get("boxfail", True) is not None
+    return value > fail
+
+
+def texts(rule, djson, start=0):
+    """Yield (entry, item, text) for the translated texts of the rule's field.
+
+    entry counts from start, item is the index in a list field or -1.
+    """
+    field = rule["field"]
+    jfield = "jp_" + field[3:]
+    for n, entry in enumerate(djson, start):
+        if field not in entry:
+            continue
+        t = entry[field]
+        j = entry.get(jfield)
+        if isinstance(t, list):
+            if not isinstance(j, list):
+                j = list()
+            pairs = enumerate(zip(t, j + [None] * (len(t) - len(j))))
+        else:
+            pairs = [(-1, (t, j))]
+        for k, (t, j) in pairs:
+            if t is None or t == "":
+                continue
+            if j is not None and (t == j or t == j.replace("\r\n", "\n")):
+                continue
+            yield n, k, t
+
+
+def text(rule, entry, item):
+    """Return the text a measurement was taken of."""
+    t = entry[rule["field"]]
+    if item >= 0:
+        return t[item]
+    return t
+
+
+def jp(rule, entry, item):
+    """Return the JP text next to it, None if there is none."""
+    j = entry.get("jp_" + rule["field"][3:])
+    if item >= 0:
+        return j[item] if isinstance(j, list) and item < len(j) else None
+    return j
+
+
+def layout(rule, entry, item):
+    """Return the lines of the text and of the JP text with their widths."""
+    t = lines(shown(rule, text(rule, entry, item)))
+    j = lines(shown(rule, jp(rule, entry, item) or ""))
+    widths = [float(w) for w in _fonts.measure_lines(t + j, "d")]
+    return t, widths[:len(t)], j, widths[len(t):]
+
+
+def plan(filenames, workers):
+    """Split the files into (filename, part, parts) jobs of similar size.
+
+    The big item files would otherwise keep one worker busy long after
+    the others ran out of work. Jobs come back biggest first.
+    """
+    sizes = dict((filename, os.path.getsize(filename)) for filename in filenames)
+    # A few jobs per worker, so the last ones to finish are small
+    target = max(sum(sizes.values()) // (workers * 4), 1)
+    jobs = list()
+    for filename in filenames:
+        parts = max(-(-sizes[filename] // target), 1)
+        for part in range(parts):
+            jobs.append((sizes[filename] / parts, (filename, part, parts)))
+    jobs.sort(key=lambda j: -j[0])
+    return [job for size, job in jobs]
+
+
+def bounds(n, part, parts):
+    """Return the (start, stop) indexes of one part of n entries."""
+    return n * part // parts, n * (part + 1) // parts
+
+
+def _call(args):
+    func, n, job = args
+    # The counts of the workers are added to the parent's, and so are the
+    # widths they measured when they are kept for the next run
+    before = _stats.snapshot()
+    m = _fonts.mark()
+    result = func(job)
+    widths = None
+    if _fonts.store:
+        widths = _fonts.since(m)
+    return n, result, _stats.since(before), widths
+
+
+def schedule(func, jobs, workers=None):
+    """Run func over every job, in a pool unless on Windows.
+
+    Idle workers take the next job from a shared queue, so give the
+    longest jobs first. The results come back in the order of jobs.
+    """
+    if platform.system() == 'Windows' or len(jobs) < 2:
+        return [func(job) for job in jobs]
+    import multiprocessing as mp
+    if workers is None:
+        workers = mp.cpu_count()
+    results = [None] * len(jobs)
+    p = mp.Pool(workers)
+    for n, result, counted, widths in p.imap_unordered(_call, [(func, n, job) for n, job in enumerate(jobs)]):
+        results[n] = result
+        _stats.merge(counted)
+        if widths:
+            _fonts.learn(widths)
+    p.close()
+    p.join()
+    return results
+
+
+def load(filename):
+    _stats.count("files")
+    with _stats.phase("parse"):
+        return _jsonio.read(filename)
+
+
+def check(job):
+    filename, part, parts = job
+    djson = load(filename)
+    start, stop = bounds(len(djson), part, parts)
+    return examine(filename, djson[start:stop], start)
+
+
+def examine(filename, djson, start=0, picked=None):
+    """Measure the entries of a file, djson starts at entry start.
+
+    picked limits the rules to those indexes.
+    """
+    found = Found()
+    _stats.count("entries", len(djson))
+    # The widths of every rule are measured all together at the end, the
+    # items of the list fields along with the plain strings
+    batch = list()
+    for i in which.get(filename, ()):
+        if picked is not None and i not in picked:
+            continue
+        rule = rules[i]
+        only = groups.get((rule.get("only"), rule["field"]))
+        unless = groups.get((rule.get("unless"), rule["field"]))
+        # The same text is measured once, unless every entry is reported
+        seen = None if rule.get("each") else set()
+        for e, k, t in texts(rule, djson, start):
+            if seen is not None:
+                if t in seen:
+                    continue
+                seen.add(t)
+            if only is not None and t not in only:
+                continue
+            if unless is not None and t in unless:
+                continue
+            n = 0
+            r = 0
+            if "maxlines" in rule or "box" in rule:
+                n = len(lines(t))
+                r = room(rule, jp(rule, djson[e - start], k))
+            if rule["measure"] == "font":
+                batch.append((i, e, k, n, r, shown(rule, t)))
+            else:
+                found.add(i, e, k, measure(rule, t), n, r)
+    if batch:
+        widths = _fonts.measure_batch([b[5] for b in batch], "d")
+        for (i, e, k, n, r, t), w in zip(batch, widths):
+            found.add(i, e, k, w, n, r)
+    _stats.count("texts", len(found))
+    return found
+
+
+def findings(filename, djson, picked=None):
+    """Yield (rule, text, value, toomany) for what a whole file has over the limits."""
+    for i, e, k, value, n, r in examine(filename, djson, 0, picked):
+        rule = rules[i]
+        if rule["measure"] != "font":
+            value = int(value)
+        if value > rule["limit"]:
+            yield rule, text(rule, djson[e], k), value, False
+        if r and n > r:
+            yield rule, text(rule, djson[e], k), n, True
+
+
+def known(dir, group, field):
+    """Return the translated texts of a field in a group of files."""
+    rule = {"field": field}
+    k = set()
+    for filename in _manifest.files(dir, group):
+        k.update(t for e, i, t in texts(rule, load(filename)))
+    return k
+
+
+def setup(dir, names=None):
+    """Pick the rules with the given names and the files they cover.
+
+    Returns the sorted paths, call again after files were added, removed or
+    when the texts of an only/unless group changed.
+    """
+    global rules
+    global which
+    global groups
+    rules = _limits.select(names)
+    manifest = _manifest.scan(dir, True)
+
+    # Every rule covering a file is checked in the same job
+    filenames = _manifest.files(dir, *set(r["files"] for r in rules))
+    which = dict(
+        (filename, [i for i, r in enumerate(rules) if filename in manifest[r["files"]]])
+        for filename in filenames
+    )
+
+    groups = dict()
+    for rule in rules:
+        for g in (rule.get("only"), rule.get("unless")):
+            if g is not None and (g, rule["field"]) not in groups:
+                groups[(g, rule["field"])] = known(dir, g, rule["field"])
+    return filenames
+
+
+def word_wrap(string, width=00.00):
+    words = string.replace(" \n", " ").replace("\n", " ").split(" ")
+    newstrings = []
+    current = ""
+    wordi = 0
+
+    while True:
+        current = ""
+        lastgood = ""
+
+        if len(words) == wordi:
+            break
+
+        while len(words) > wordi:
+            current = current
+
+            if (current == ""):
+                current += words[wordi]
+            else:
+                current += " " + words[wordi]
+
+            if (_fonts.textlength(remove_html_markup(current)) >= width):
+                break
+
+            lastgood = current
+            wordi += 1
+
+        if (lastgood == "" and len(words) > wordi):
+            lastgood = words[wordi]
+            wordi += 1
+
+        if (lastgood != ""):
+            newstrings.append(lastgood)
+
+    warped = "\n".join(newstrings)
+
+    return warped
+
+
+def where(entry, index=None):
+    """Return where an entry is, by the ids it has or its index."""
+    if "eventNo" in entry:
+        return "fileID {} eventNo {}".format(entry.get("fileID"), entry["eventNo"])
+    for key in ("assign", "id", "text_id", "title_id"):
+        if key in entry:
+            return "{} {}".format(key, entry[key])
+    return "entry {}".format(index)
+
+
+def message(rule, text, value, toomany=False, at=None):
+    t = text.replace("\r\n", "\\r\\n").replace("\n", "\\n")
+    if at is not None:
+        value = "{} ({})".format(value, at)
+    if toomany or rule["measure"] == "lines":
+        return "{} '{}' has too many lines: {}".format(rule["label"], t, value)
+    return "{} '{}' is too long: {}".format(rule["label"], t, value)
+
+
+def boxed(rule, f, at, t, tw, j, jw):
+    """Print a text that does not fit its box, line by line next to the JP
+    text. Return True if it fails the check."""
+    problems = list()
+    failed = False
+    for n, w in enumerate(tw, 1):
+        if w > rule["limit"]:
+            problems.append("line {} is too long: {:.2f}".format(n, w))
+            failed = failed or fails(rule, w)
+    r = room(rule, "\n".join(j))
+    if len(t) > r:
+        problems.append("has too many lines: {}, the box has {}".format(len(t), r))
+        failed = failed or fails(rule, len(t), True)
+    print("{} {}: {} {}".format(f, at, rule["label"], ", ".join(problems)))
+    # The lines over the limit get a *
+    for line, w in zip(t, tw):
+        print("  EN {:6.2f}{} {}".format(w, "*" if w > rule["limit"] else " ", line))
+    for line, w in zip(j, jw):
+        print("  JP {:6.2f}  {}".format(w, line))
+    return failed
+
+
+def located(AT, key, value):
+    """Return (text, value, where) for a key of the report."""
+    if isinstance(key, tuple):
+        return key[0], value, key[1]
+    return key, value, AT.get(key)
+
+
+def main(names=None, argv=None):
+    """Check the rules with the given names, or all of them.
+
+    argv works like the old checker scripts: the json path, then a font
+    scale which also turns on dumping every measurement as JSON.
+    --top N lists the N longest texts of each rule instead, over the limit
+    or not.
+    """
+    if argv is None:
+        argv = sys.argv
+
+    top = 0
+    if "--top" in argv:
+        n = argv.index("--top")
+        top = int(argv[n + 1])
+        argv = argv[:n] + argv[n + 2:]
+
+    # Need the json path
+    if len(argv) < 2:
+        dir = "json"
+    else:
+        dir = argv[1]
+
+    filenames = setup(dir, names)
+
+    if any(r["measure"] == "font" for r in rules):
+        if len(argv) == 3 and argv[2] != "0":
+            _fonts.init(int(argv[2]))
+        elif platform.system() == 'Windows':
+            _fonts.init(1)
+        else:
+            _fonts.init()
+
+    jobs = plan(filenames, os.cpu_count() or 1)
+    results = schedule(check, jobs)
+    # Back in file order
+    order = dict((filename, n) for n, filename in enumerate(filenames))
+    results = sorted(zip(jobs, results), key=lambda j: (order[j[0][0]], j[0][1]))
+
+    # The "file:text" names are only made for what gets reported, every
+    # measurement when dumping or listing the top ones
+    everything = len(argv) == 3 or top
+    FS = [dict() for r in rules]
+    FSL = [dict() for r in rules]
+    # Where the items of list fields were first seen, as (file, entry, index)
+    AT = [dict() for r in rules]
+    # The texts over a box, every entry with its layout
+    BOX = [list() for r in rules]
+    djson = None
+    filename = None
+    for job, found in results:
+        for i, e, k, value, n, r in found:
+            rule = rules[i]
+            if rule["measure"] != "font":
+                value = int(value)
+            toomany = r and n > r
+            if not everything and value <= rule["limit"] and not toomany:
+                continue
+            if filename != job[0]:
+                filename = job[0]
+                f = os.path.splitext(os.path.basename(filename))[0]
+                djson = load(filename)
+            if "box" in rule and not everything:
+                at = where(djson[e], e) if k < 0 else "{}, item {}".format(where(djson[e], e), k)
+                BOX[i].append((f, at) + layout(rule, djson[e], k))
+                continue
+            fc = "{}:{}".format(f, text(rule, djson[e], k))
+            if rule.get("each") and not everything:
+                # Every entry on its own, by where it is
+                fc = (fc, where(djson[e], e) if k < 0 else "{}, item {}".format(where(djson[e], e), k))
+            FS[i][fc] = value
+            if k >= 0 and fc not in AT[i]:
+                AT[i][fc] = "{}, item {}".format(where(djson[e], e), k)
+            if toomany:
+                FSL[i][fc] = n
+    djson = None
+
+    counterr = 0
+    if len(argv) == 3:
+        dump = OrderedDict()
+        for i, rule in enumerate(rules):
+            dump.setdefault(rule["name"], dict()).update(FS[i])
+        if len(dump) == 1:
+            _report.dump(dump.popitem()[1])
+        else:
+            _report.dumpall(dump.items())
+    elif top:
+        for i, rule in enumerate(rules):
+            for e, s in _report.top(FS[i].items(), top):
+                print(message(rule, e, s))
+    else:
+        for i, rule in enumerate(rules):
+            for e, s in _report.over(FS[i], rule["limit"]):
+                if fails(rule, s):
+                    counterr += 1
+                e, s, at = located(AT[i], e, s)
+                print(message(rule, e, s, at=at))
+            # Only the texts over their room are there
+            for e, s in _report.over(FSL[i], 0):
+                if fails(rule, s, True):
+                    counterr += 1
+                e, s, at = located(AT[i], e, s)
+                print(message(rule, e, s, True, at))
+            for box in BOX[i]:
+                if boxed(rule, *box):
+                    counterr += 1
+
+    if counterr > 0:
+        return "Issues found"
+    return 0
@@ -1,38 +1,305 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import _stats
+import atexit
 import os
-from PIL import ImageFont
 
 fontS = None
 fontR = None
+fontfile = os.path.join(
+    os.path.dirname(
+        os.path.realpath(__file__)
+    ),
+    "DF-HeiSeiGothic-W7003.ttf"
+)
+
+# The width of every line measured, most recently used last. The same item
+# names, chip names and description lines come back across files, and the
+# word wrap measures the same prefixes again.
+cache = dict()
+maxsize = 1 << 17
+# What this process measured, in order, see mark() and since()
+fresh = list()
+# Set PSO2ES_FONT_CACHE to a file to start from the widths of the last run
+# and keep the new ones for the next
+store = os.environ.get("PSO2ES_FONT_CACHE")
+
+# The advance and the right edge of every glyph by code point, NaN until
+# measured, and the kerning of the pairs seen so far, see measure_batch()
+advances = None
+rights = None
+kerning = dict()
+kerned = False
 
 
 def init(scale=4):
+    # Pillow is only pulled in once a font is actually needed
+    from PIL import ImageFont
     global fontR
     global fontS
     size = 72
     size *= scale
     fontS = scale
-    font = os.path.join(
-        os.path.dirname(
-            os.path.realpath(__file__)
-        ),
-        "DF-HeiSeiGothic-W7003.ttf"
-    )
+    font = fontfile
 # "DF-SouGei-W7003.ttf"
 # "DF-HeiSeiGothic-W7003.ttf"
     fontR = ImageFont.truetype(
         font=font,
         size=size
     )
+    # The widths depend on the font and the scale
+    cache.clear()
+    del fresh[:]
+    global advances
+    global rights
+    global kerned
+    advances = None
+    rights = None
+    kerning.clear()
+    kerned = b"kern" in tables(font)
+    if store:
+        load(store)
+
+
+def getsize(text):
+    # Pillow 10 dropped getsize(), the right/bottom of the bbox is the same
+    if hasattr(fontR, "getsize"):
+        return fontR.getsize(text)
+    left, top, right, bottom = fontR.getbbox(text)
+    return (right, bottom)
+
+
+def width(line):
+    """Return the width of one line in pixels, from the cache if it can."""
+    w = cache.pop(line, None)
+    if w is None:
+        _stats.count("width_cache_misses")
+        w = getsize(line)[0]
+        fresh.append((line, w))
+        if len(cache) >= maxsize:
+            # Drop the least recently used
+            del cache[next(iter(cache))]
+    else:
+        _stats.count("width_cache_hits")
+    cache[line] = w
+    return w
 
 
 def textlength(name=""):
     global fontR
     global fontS
-    w = -1
-    h = -1
-    t = name.replace("<%br>", "\n").replace("<br>", "\n").replace("\\n", "\n").rstrip()
-    for sl in t.splitlines():
-        w, h = max(fontR.getsize(sl), (w, h))
-    return w / (72 * fontS)
+    _stats.count("textlength")
+    with _stats.phase("measure"):
+        w = -1
+        t = name.replace("<%br>", "\n").replace("<br>", "\n").replace("\\n", "\n").rstrip()
+        for sl in t.splitlines():
+            w = max(width(sl), w)
+        return w / (72 * fontS)
+
+
+def tables(filename):
+    """Return the tags of the tables in a TrueType file."""
+    import struct
+    with open(filename, "rb") as f:
+        head = f.read(12)
+        n = struct.unpack(">H", head[4:6])[0]
+        directory = f.read(16 * n)
+    return set(directory[16 * i:16 * i + 4] for i in range(n))
+
+
+def batched():
+    """Can measure_batch() add up the glyphs, or does it need textlength()?
+
+    Adding up only works with the basic layout, Raqm shapes the text.
+    """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return hasattr(fontR, "getlength") and fontR.layout_engine == 0
+
+
+def glyphs(numpy, codes):
+    """Measure the glyphs of the code points not in the table yet."""
+    global advances
+    global rights
+    top = int(codes.max()) + 1
+    if advances is None or len(advances) < top:
+        size = max(top, 0x10000)
+        grown = numpy.full(size, numpy.nan)
+        grownr = numpy.full(size, numpy.nan)
+        if advances is not None:
+            grown[:len(advances)] = advances
+            grownr[:len(rights)] = rights
+        advances = grown
+        rights = grownr
+    missing = numpy.unique(codes[numpy.isnan(advances[codes])])
+    _stats.count("glyphs", len(missing))
+    for c in missing.tolist():
+        ch = chr(c)
+        advances[c] = fontR.getlength(ch)
+        rights[c] = getsize(ch)[0]
+
+
+def kerns(numpy, pairs):
+    """Return the kerning of every pair of code points, (left << 21) | right."""
+    unknown = numpy.unique(pairs)
+    unknown = unknown[numpy.array([p not in kerning for p in unknown.tolist()], dtype=bool)]
+    for p in unknown.tolist():
+        left = chr(p >> 21)
+        right = chr(p & 0x1FFFFF)
+        kerning[p] = fontR.getlength(left + right) - advances[p >> 21] - advances[p & 0x1FFFFF]
+    keys = numpy.fromiter(kerning.keys(), dtype=numpy.uint64, count=len(kerning))
+    values = numpy.fromiter(kerning.values(), dtype=numpy.float64, count=len(kerning))
+    order = numpy.argsort(keys)
+    keys = keys[order]
+    return values[order][numpy.searchsorted(keys, pairs)]
+
+
+def pixels(numpy, lines):
+    """Return the width of every line in pixels, as an array of doubles.
+
+    The lines are put together in one array of code points and the widths
+    of their glyphs are added up, instead of asking Pillow for every line.
+    A line is as wide as the advances of its glyphs but the last one, plus
+    the right edge of the last one, the same as getsize() gives.
+    """
+    lengths = numpy.fromiter(map(len, lines), dtype=numpy.int64, count=len(lines))
+    ends = numpy.cumsum(lengths)
+    starts = ends - lengths
+    full = lengths > 0
+
+    # Every line that is not empty, glyph by glyph
+    codes = numpy.frombuffer("".join(lines).encode("utf-32-le", "surrogatepass"), dtype=numpy.uint32)
+    widths = numpy.zeros(len(lines))
+    if len(codes):
+        glyphs(numpy, codes)
+        values = advances[codes]
+        last = ends[full] - 1
+        values[last] = rights[codes[last]]
+        if kerned:
+            # The pairs in the same line
+            pairs = (codes[:-1].astype(numpy.uint64) << 21) | codes[1:]
+            inside = numpy.ones(len(pairs), dtype=bool)
+            inside[last[last < len(pairs)]] = False
+            values[:-1][inside] += kerns(numpy, pairs[inside])
+        widths[full] = numpy.add.reduceat(values, starts[full])
+        if kerned:
+            # Pillow places the kerned glyphs on whole pixels, ask it
+            # about the lines that did not add up to one
+            for n in numpy.flatnonzero(widths != numpy.floor(widths)).tolist():
+                widths[n] = width(lines[n])
+    return widths
+
+
+def measure_lines(lines, typecode="f"):
+    """Return the width of every line, in the unit of textlength().
+
+    The lines are measured as they are, without splitting them or taking
+    the spaces off their end.
+    """
+    _stats.count("measure_lines", len(lines))
+    if not batched():
+        from array import array
+        return array(typecode, [width(line) / (72 * fontS) for line in lines])
+    import numpy
+    with _stats.phase("measure"):
+        return (pixels(numpy, lines) / (72 * fontS)).astype(typecode)
+
+
+def measure_batch(names, typecode="f"):
+    """Return textlength() of every name, as float32 unless typecode says else.
+
+    See pixels() for how the lines are measured.
+    """
+    _stats.count("measure_batch", len(names))
+    if not batched():
+        from array import array
+        return array(typecode, [textlength(name) for name in names])
+    import numpy
+    with _stats.phase("measure"):
+        lines = list()
+        counts = list()
+        for name in names:
+            t = name.replace("<%br>", "\n").replace("<br>", "\n").replace("\\n", "\n").rstrip()
+            ls = t.splitlines()
+            lines.extend(ls)
+            counts.append(len(ls))
+        widths = pixels(numpy, lines)
+
+        # The widest line of every name, -1 for a name without any
+        counts = numpy.array(counts, dtype=numpy.int64)
+        some = counts > 0
+        w = numpy.full(len(names), -1.0)
+        if some.any():
+            w[some] = numpy.maximum.reduceat(widths, (numpy.cumsum(counts) - counts)[some])
+        return (w / (72 * fontS)).astype(typecode)
+
+
+def mark():
+    """Remember how much was measured, for since()."""
+    return len(fresh)
+
+
+def since(n):
+    """Return the widths measured after mark() returned n.
+
+    A pool worker sends them back so the parent can learn() them.
+    """
+    return fresh[n:]
+
+
+def learn(widths):
+    for line, w in widths:
+        if line not in cache:
+            cache[line] = w
+            fresh.append((line, w))
+    while len(cache) > maxsize:
+        del cache[next(iter(cache))]
+
+
+def stamp():
+    st = os.stat(fontfile)
+    return [os.path.basename(fontfile), st.st_size]
+
+
+def read(filename):
+    import json
+    try:
+        with open(filename, encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return dict()
+    if stored.get("font") != stamp():
+        return dict()
+    return stored["scales"]
+
+
+def load(filename):
+    """Start from the widths stored by an earlier run with the same font."""
+    widths = read(filename).get(str(fontS), list())
+    for line, w in widths:
+        cache[line] = w
+    _stats.count("width_cache_loaded", len(widths))
+
+
+def save(filename):
+    """Store the widths for the next run, if anything new was measured.
+
+    The widths of the other scales in the file are kept.
+    """
+    import json
+    if fontR is None or not fresh:
+        return
+    scales = read(filename)
+    scales[str(fontS)] = list(cache.items())
+    tmp = filename + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"font": stamp(), "scales": scales}, f, ensure_ascii=False)
+    os.replace(tmp, filename)
+
+
+@atexit.register
+def _save():
+    if store:
+        save(store)
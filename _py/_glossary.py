@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _jsonio
+import _matcher
+import codecs
+from collections import OrderedDict
+import os
+
+# The JP terms and how they are always translated, kept in glossary.json:
+#
+# jp:    the JP term
+# en:    its translation
+# also:  optional, other translations that are fine too
+# kind:  optional, lets the _tools scripts pick the terms they use
+#
+# termcheck.py checks that the translations use them, the _tools scripts
+# that translate texts on their own take their terms from here.
+
+path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "glossary.json")
+
+
+def load(filename=path):
+    with codecs.open(filename, mode='r', encoding='utf-8') as json_file:
+        return _jsonio.load(json_file)
+
+
+def terms(kind=None, filename=path):
+    """Return the JP terms and their translation, all or those of one kind."""
+    return OrderedDict(
+        (term["jp"], term["en"]) for term in load(filename)
+        if kind is None or term.get("kind") == kind)
+
+
+def matcher(glossary):
+    """Return a Matcher giving the glossary entry of every JP term."""
+    m = _matcher.Matcher()
+    for term in glossary:
+        m.add(term["jp"], term)
+    return m.build()
+
+
+def longest(hits):
+    """Keep the longest of the (start, end, value) hits that overlap."""
+    kept = list()
+    for start, end, value in sorted(hits, key=lambda h: (h[0], -h[1])):
+        if kept and start < kept[-1][1]:
+            continue
+        kept.append((start, end, value))
+    return kept
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _writeback
+import json
+import os
+
+# Read and write the JSON files with the quickest parser installed: orjson,
+# then simdjson and ujson, then the json module. PSO2ES_JSON=json (or the
+# name of another one) picks one.
+#
+# dumps() writes what json.dumps(obj, ensure_ascii=False, indent="\t") does,
+# byte for byte, whichever parser reads: orjson's two space indent turned
+# into tabs when orjson is there. Only floats come out differently (1e16
+# for 1e+16, null for NaN), the JSON files have none. Objects come back as
+# plain dicts, in the order of the file.
+#
+# ./_bench/jsonio.py checks both against the json module over a json folder.
+
+wanted = os.environ.get("PSO2ES_JSON")
+
+
+def _backends():
+    for name in ("orjson", "simdjson", "ujson"):
+        if wanted is not None and wanted != name:
+            continue
+        try:
+            module = __import__(name)
+        except ImportError:
+            continue
+        if getattr(module, "loads", None) is not None:
+            return name, module
+    return "json", json
+
+
+backend, _module = _backends()
+_orjson = _module if backend == "orjson" else None
+
+
+def loads(data):
+    """Parse a str or the UTF-8 bytes of one."""
+    if backend == "json" and isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return _module.loads(data)
+
+
+def load(fp):
+    return loads(fp.read())
+
+
+def _tabs(out):
+    """orjson's two space indent as tabs, a text has no line breaks in it."""
+    depth = 1
+    while b"\n" + b"  " * depth in out:
+        depth += 1
+    # The deepest first, a shorter run of spaces starts the deeper lines too
+    for n in range(depth - 1, 0, -1):
+        out = out.replace(b"\n" + b"  " * n, b"\n" + b"\t" * n)
+    return out
+
+
+def _dumpb(obj):
+    """dumps() as UTF-8."""
+    if _orjson is not None:
+        try:
+            return _tabs(_orjson.dumps(obj, option=_orjson.OPT_INDENT_2))
+        except TypeError:
+            # Not for orjson, like an int over 64 bits or a key that is not
+            # a str
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent="\t", sort_keys=False).encode("utf-8")
+
+
+def dumps(obj):
+    """json.dumps(obj, ensure_ascii=False, indent="\\t"), quicker."""
+    return _dumpb(obj).decode("utf-8")
+
+
+def dump(obj, fp):
+    fp.write(dumps(obj))
+
+
+def read(filename):
+    """Parse a JSON file, as this run will have written it."""
+    data = _writeback.get(filename)
+    if data is None:
+        with open(filename, mode='rb') as json_file:
+            data = json_file.read()
+    return loads(data)
+
+
+def write(filename, obj):
+    """Write a JSON file as the tools do, with a line break at the end.
+
+    The file is written with the others when the run ends, see
+    _writeback.py.
+    """
+    _writeback.put(filename, _dumpb(obj) + b"\n")
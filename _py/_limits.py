@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Every size limit of the game UI, checked by _checker in one pass.
+#
+# name:     what the checker scripts ask for, one script can run several
+# files:    a group from _manifest
+# field:    the tr_ field to measure, lists are measured item by item and
+#           reported with the entry and the index of the item
+# measure:  "font" for the width in full-width characters,
+#           "len" for the number of characters,
+#           "lines" for the number of lines
+# limit:    the largest value that still fits
+# maxlines: optional, the most lines the field can show
+# label:    how the field is called in the report
+#
+# A text is measured and reported once per rule and file, however many
+# entries have it, and texts the same as their JP text are not measured.
+#
+# Optional:
+# markup:   strip the <tags> before measuring
+# cut:      only measure the text in front of this marker
+# only:     only check texts that are also translated in this group
+# unless:   skip texts that are also translated in this group
+# fail:     report everything over limit, but only fail above this value,
+#           None to never fail
+# each:     measure and report every entry by where it is, even when the
+#           text came up before
+# box:      the lines of the dialogue box, as many as the JP text has when
+#           that is more. Every line is measured, and what does not fit is
+#           reported line by line next to the JP text
+# boxfail:  None to report the texts with more lines than the box without
+#           failing
+rules = [
+    # JP MAX: 25.21, MAX: 27.34
+    {"name": "ItemFont", "files": "item", "field": "tr_text", "measure": "font", "limit": 18, "label": "Item Name"},
+    # JP MAX: 42.73, MAX: 32
+    {"name": "ItemDescFont", "files": "item_desc", "field": "tr_explain", "measure": "font", "limit": 17.7,
+     "markup": True, "fail": None, "label": "Item Desc"},
+    # JP MAX: 46.86, MAX: 42.5
+    {"name": "ChipDescLong", "files": "chip_explain", "field": "tr_explainLong", "measure": "font", "limit": 24.67,
+     "markup": True, "label": "Chip Long explain"},
+    # JP MAX: 36.79
+    {"name": "ChipDescShort", "files": "chip_explain", "field": "tr_explainShort", "measure": "font", "limit": 21.5,
+     "markup": True, "label": "Chip Short explain"},
+    {"name": "ChipFont", "files": "chip_name", "field": "tr_text", "measure": "font", "limit": 31.58,
+     "unless": "weapon", "label": "Chip Name"},
+    # Weaponoid chips show their name in a smaller box
+    {"name": "ChipFont", "files": "chip_name", "field": "tr_text", "measure": "font", "limit": 19.61,
+     "only": "weapon", "label": "Weaponoid Chip Name"},
+    # JP MAX: 37.53, TXT MAX: 45
+    # Advisory for now: the box line counts never fail, nor anything in the
+    # story_new files, until their translations are fixed. Only lines over
+    # the width limit in the other story files fail.
+    {"name": "StoryFont", "files": "story", "field": "tr_text", "measure": "font", "limit": 24.75, "box": 2,
+     "each": True, "boxfail": None, "label": "Story Text"},
+    {"name": "StoryFont", "files": "story_new", "field": "tr_text", "measure": "font", "limit": 24.75, "box": 2,
+     "each": True, "fail": None, "boxfail": None, "label": "Story Text"},
+    # JP MAX: 34.24, centered text is allowed to run over a bit
+    {"name": "StoryBTNFont", "files": "story", "field": "tr_buttons", "measure": "font", "limit": 25.26, "fail": 64,
+     "label": "Story Button"},
+    {"name": "StoryBTNFont", "files": "story_new", "field": "tr_buttons", "measure": "font", "limit": 25.26, "fail": 64,
+     "label": "Story Button"},
+    # JP MAX: 31.12, MAX: 41.7?
+    {"name": "DiceFont", "files": "dice", "field": "tr_patterns", "measure": "font", "limit": 21.58,
+     "label": "Dice SpeakText"},
+    # Never checked before the rules, reported without failing until the
+    # texts fit
+    {"name": "DiceLen", "files": "dice", "field": "tr_patterns", "measure": "lines", "limit": 3, "fail": None,
+     "each": True, "label": "Dice SpeakText"},
+    # JP MAX: 22
+    {"name": "ItemLen", "files": "item", "field": "tr_text", "measure": "len", "limit": 31, "fail": None,
+     "label": "Item Name"},
+    {"name": "BlockLen", "files": "block", "field": "tr_text", "measure": "len", "limit": 27, "label": "Block Name"},
+    {"name": "TitleLen", "files": "title", "field": "tr_text", "measure": "len", "limit": 32, "label": "Title Name"},
+    # The <yellow> notes at the end of a 3 line description get their own box
+    {"name": "ItemDescLen", "files": "item_desc3", "field": "tr_explain", "measure": "lines", "limit": 3,
+     "cut": "\n<yellow>", "fail": None, "each": True, "label": "Item Desc"},
+    {"name": "ItemDescLen", "files": "item_desc4", "field": "tr_explain", "measure": "lines", "limit": 4, "fail": None,
+     "each": True, "label": "Item Desc"},
+    {"name": "ItemDescLen", "files": "item_desc5", "field": "tr_explain", "measure": "lines", "limit": 5, "fail": None,
+     "each": True, "label": "Item Desc"},
+]
+
+
+def select(names=None):
+    """Return the rules with one of the given names, or all of them."""
+    if not names:
+        return list(rules)
+    return [r for r in rules if r["name"] in names]
+
+
+def limit(name):
+    """Return the width limit of the first rule with that name."""
+    return select([name])[0]["limit"]
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _stats
+import fnmatch
+import os
+import re
+
+# Named groups of JSON files, every script asks for its files by group name.
+# Add a pattern here instead of walking the json folder again.
+# An entry starting with "-" names another group whose files are left out.
+groups = {
+    "json": ["*.txt"],
+    "block": ["Block_*.txt"],
+    "title": ["Title_*.txt"],
+    "chip_explain": ["ChipExplain_*.txt"],
+    "chip_name": ["Name_Chip_*.txt"],
+    "weapon": ["Item_Weapon_*.txt"],
+    "dice": ["Leisure_PhotonDice_SpeakText.txt"],
+    "story": [
+        "Season*_Text.txt",
+        "SideStoryEvent_Text.txt",
+        "UI_Weaponoid_SideStoryOpen.txt",
+    ],
+    # Stories checked since, reported without failing until they fit
+    "story_new": [
+        "Special_Text.txt",
+        "Arles_Text.txt",
+        "Nemesis_Text.txt",
+        "Orbit_Text.txt",
+        "Seiga_Text.txt",
+    ],
+    # Item names
+    "item": [
+        "Item_*.txt",
+        "Explain_Actor_*.txt",
+        "Explain_SkillRing.txt",
+        "Explain_System.txt",
+        "Items_Leftovers.txt",
+    ],
+    # Item names checked against each other by dupcheck
+    "item_map": [
+        "Item_*.txt",
+        "Explain_SkillRing.txt",
+        "Explain_System.txt",
+        "Items_Leftovers.txt",
+    ],
+    # Item names ItemImport keeps in sync with the CSV
+    "item_import": [
+        "Item_*.txt",
+        "Explain_Actor_*.txt",
+        "Explain_SkillRing.txt",
+        "Explain_System.txt",
+        "Name_Actor_MagName.txt",
+        "Name_UICharMake_*.txt",
+    ],
+    # Item descriptions with a width limit
+    "item_desc": [
+        "Item_*.txt",
+        "Explain_Actor_Mag*.txt",
+        "Explain_Actor_StackDeviceSAA.txt",
+        "Explain_SkillRing.txt",
+        "Explain_System.txt",
+        "Items_Leftovers.txt",
+    ],
+    # Item descriptions with 3 lines
+    "item_desc3": [
+        "Item_*.txt",
+        "Explain_Actor_*.txt",
+        "Explain_SkillRing.txt",
+        "Explain_System.txt",
+        "-item_desc4",
+        "-item_desc5",
+    ],
+    # Item descriptions with 4 lines
+    "item_desc4": [
+        "Items_Leftovers.txt",
+        "Item_BaseWear_*.txt",
+        "Item_QuestTrigger.txt",
+        "Item_Stack_BodyPaint.txt",
+        "Item_Stack_GachaTradePass.txt",
+        "Item_Stack_Gat*.txt",
+        "Item_Stack_ItemBag.txt",
+        "Item_Stack_Music.txt",
+        "Item_Stack_PaidPass.txt",
+        "Item_Stack_PaidTicket.txt",
+        "Item_Stack_Roomgoods.txt",
+        "Item_Stack_Sticker.txt",
+        "Item_AvatarWPN_*.txt",
+        "Item_Stack_Orderitem.txt",
+        "-item_desc5",
+    ],
+    # Item descriptions with 5 lines
+    "item_desc5": [
+        "Item_Stack_Ring?.txt",
+        "Item_Stack_GatBoost.txt",
+    ],
+    # Items that can copy their translation from a duplicate
+    "item_dupes": [
+        "Item_Stack_*.txt",
+        "Item_*Wear_*.txt",
+    ],
+    # The words the game does not let through, and the ones it does not
+    # let through in names
+    "ngword": ["NGWord_Alphabet.txt", "NGWord_Japanese.txt"],
+    "ngname": ["NGWord_Name_*.txt"],
+    # Only NFC normalize these, NFKC breaks them
+    "nfc": [
+        "UI_Text.txt",
+        "Name_Quest_AreaName.txt",
+        "ChipExplain_ActiveExplain.txt",
+        "ChipExplain_SupportExplain.txt",
+    ],
+}
+
+_compiled = None
+_cache = dict()
+
+
+def compile_groups():
+    global _compiled
+    if _compiled is None:
+        # One regex per group, so a file is tested once per group and not
+        # once per pattern
+        _compiled = [
+            (name, re.compile("|".join(
+                fnmatch.translate(p) for p in patterns if not p.startswith("-")) or "(?!)"))
+            for name, patterns in groups.items()
+        ]
+    return _compiled
+
+
+def exclude(manifest):
+    done = set()
+
+    def resolve(name):
+        if name in done:
+            return manifest[name]
+        done.add(name)
+        for p in groups[name]:
+            if p.startswith("-"):
+                manifest[name] -= resolve(p[1:])
+        return manifest[name]
+
+    for name in groups:
+        resolve(name)
+
+
+def classify(filename):
+    """Return the names of the groups a file name belongs to."""
+    f = os.path.normcase(os.path.basename(filename))
+    manifest = dict((name, {f} if rx.match(f) else set()) for name, rx in compile_groups())
+    exclude(manifest)
+    return [name for name in groups if manifest[name]]
+
+
+def scan(dir="json", refresh=False):
+    """Walk dir once and return a dict of group name to set of paths.
+
+    The result is cached per directory, pass refresh=True after adding or
+    removing files.
+    """
+    key = os.path.realpath(dir)
+    if not refresh and key in _cache:
+        return _cache[key]
+    with _stats.phase("discover"):
+        compiled = compile_groups()
+        manifest = dict((name, set()) for name, rx in compiled)
+        for dirpath, dirnames, files in os.walk(dir):
+            _stats.count("scanned", len(files))
+            for f in files:
+                nf = os.path.normcase(f)
+                path = None
+                for name, rx in compiled:
+                    if rx.match(nf):
+                        if path is None:
+                            path = os.path.join(dirpath, f)
+                        manifest[name].add(path)
+        exclude(manifest)
+    _cache[key] = manifest
+    return manifest
+
+
+def files(dir="json", *names):
+    """Return the sorted paths in the union of the named groups."""
+    manifest = scan(dir)
+    found = set()
+    for name in names:
+        found |= manifest[name]
+    return sorted(found)
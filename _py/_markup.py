@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from collections import Counter
+import re
+
+# The markup and the placeholders of the game's texts, which have to be in
+# a translation as they are in the JP text:
+#
+#   <%CHARANAME>, <%abi>, <%parameter1%>  filled in by the game
+#   <%br>                                a line break
+#   <color=#ff0000>...</color>           a colour, <color=#ffff00<%alpha>> too
+#   <size=30>...</size>                  a size
+#   <yellow>...<c>, <c a1ff6d>...<c>     a colour, <c> ends it
+#
+# Anything else between < and > is text.
+
+scanner = re.compile(
+    r"<%[^<>%\s]+%?>"
+    r"|</?(?:color|size)(?:=(?:[^<>]|<%[^<>]*>)*)?>"
+    r"|</?yellow>"
+    r"|</?c(?: [0-9A-Fa-f]{6})?>")
+
+# The closing tags, and the opening ones they close
+closes = {
+    "</color>": ("color",),
+    "</size>": ("size",),
+    "</yellow>": ("yellow",),
+    "<c>": ("yellow", "c"),
+    "</c>": ("yellow", "c"),
+}
+
+_cache = dict()
+
+
+def tokens(text):
+    """Return the markup of a text, in order.
+
+    Texts are cached, the same ones come up in many files.
+    """
+    found = _cache.get(text)
+    if found is None:
+        found = tuple(scanner.findall(text))
+        _cache[text] = found
+    return found
+
+
+def placeholder(token):
+    return token.startswith("<%")
+
+
+def kind(token):
+    """The name of an opening tag, None for the rest."""
+    if placeholder(token) or token.startswith("</") or token in closes:
+        return None
+    return token[1:-1].split("=")[0].split(" ")[0]
+
+
+def nesting(found):
+    """Return what is wrong with the nesting of the tokens, or an empty list."""
+    problems = list()
+    stack = list()
+    for token in found:
+        if token in closes:
+            if stack and stack[-1] in closes[token]:
+                stack.pop()
+            else:
+                problems.append("{} without its opening tag".format(token))
+        else:
+            name = kind(token)
+            if name is not None:
+                stack.append(name)
+    for name in stack:
+        problems.append("<{}> not closed".format(name))
+    return problems
+
+
+def compare(jp, tr):
+    """Return what is wrong with the markup of a translation, or an empty list.
+
+    Every token of the JP text has to be in the translation as often, line
+    breaks aside as the lines are laid out again. The translation can add
+    colours and sizes, but not placeholders the game does not fill in here.
+    """
+    problems = list()
+    want = Counter(token for token in tokens(jp) if token != "<%br>")
+    have = Counter(token for token in tokens(tr) if token != "<%br>")
+    missing = want - have
+    if missing:
+        problems.append("misses " + " ".join(sorted(missing.elements())))
+    extra = Counter(dict((token, n) for token, n in (have - want).items() if placeholder(token)))
+    if extra:
+        problems.append("has " + " ".join(sorted(extra.elements())) + " not in the JP text")
+    # The JP text's own mistakes are not the translation's
+    known = nesting(tokens(jp))
+    problems.extend(problem for problem in nesting(tokens(tr)) if problem not in known)
+    return problems
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from collections import deque
+
+
+class Matcher(object):
+    """Find any of many words in a text in one pass (Aho-Corasick).
+
+    add() every word, then build() once before find(). Looking through a
+    text costs the same however many words there are.
+    """
+    __slots__ = ("goto", "fail", "out", "built")
+
+    def __init__(self, words=()):
+        # One dict of the next states per state, the state to fall back to
+        # when a character does not follow and the words ending there
+        self.goto = [dict()]
+        self.fail = [0]
+        self.out = [()]
+        self.built = False
+        for word in words:
+            self.add(word)
+
+    def add(self, word, value=None):
+        """Add a word, find() gives value (the word by default) for it."""
+        if word == "":
+            return
+        s = 0
+        for c in word:
+            n = self.goto[s].get(c)
+            if n is None:
+                n = len(self.goto)
+                self.goto[s][c] = n
+                self.goto.append(dict())
+                self.fail.append(0)
+                self.out.append(())
+            s = n
+        self.out[s] = self.out[s] + ((len(word), word if value is None else value),)
+        self.built = False
+
+    def build(self):
+        goto = self.goto
+        fail = self.fail
+        out = self.out
+        queue = deque(goto[0].values())
+        for n in queue:
+            fail[n] = 0
+        while queue:
+            s = queue.popleft()
+            for c, n in goto[s].items():
+                queue.append(n)
+                f = fail[s]
+                while f and c not in goto[f]:
+                    f = fail[f]
+                fail[n] = goto[f].get(c, 0)
+                # The shorter words ending here too
+                out[n] = out[n] + out[fail[n]]
+        self.built = True
+        return self
+
+    def find(self, text):
+        """Yield (start, end, value) for every word in text, overlapping or not."""
+        if not self.built:
+            self.build()
+        goto = self.goto
+        fail = self.fail
+        out = self.out
+        s = 0
+        for i, c in enumerate(text):
+            while s and c not in goto[s]:
+                s = fail[s]
+            s = goto[s].get(c, 0)
+            for n, value in out[s]:
+                yield i + 1 - n, i + 1, value
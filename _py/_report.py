@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _stats
+import heapq
+import json
+import sys
+
+
+def order(item):
+    # Smallest value first, then by name, like the reports always were
+    return item[1], item[0]
+
+
+def over(FS, limit):
+    """Return the (key, value) pairs above limit, sorted by value.
+
+    Only the pairs over the limit get sorted, everything else is skipped
+    on the way through.
+    """
+    with _stats.phase("sort"):
+        return sorted(((key, value) for key, value in FS.items() if value > limit), key=order)
+
+
+def top(items, n):
+    """Return the n largest (key, value) pairs, largest first.
+
+    items can be any iterable, it is only walked once and at most n pairs
+    are kept.
+    """
+    with _stats.phase("sort"):
+        return heapq.nlargest(n, items, key=order)
+
+
+def stream(items, level=1):
+    """Yield the lines of a JSON object of the (key, value) pairs.
+
+    The output is the same as json.dumps(dict(items), indent="\\t"), but
+    the pairs are written as they come instead of being built up in memory.
+    """
+    indent = "\t" * level
+    first = True
+    for key, value in items:
+        if first:
+            yield "{\n"
+            first = False
+        else:
+            yield ",\n"
+        yield "{}{}: {}".format(indent, json.dumps(key, ensure_ascii=False), json.dumps(value))
+    if first:
+        yield "{}"
+    else:
+        yield "\n" + "\t" * (level - 1) + "}"
+
+
+def dump(FS, out=None):
+    """Write every measurement sorted by value, as a JSON object."""
+    if out is None:
+        out = sys.stdout
+    with _stats.phase("sort"):
+        items = sorted(FS.items(), key=order)
+    for line in stream(items):
+        out.write(line)
+    out.write("\n")
+
+
+def dumpall(named, out=None):
+    """Write several measurement dicts as one JSON object, keyed by name."""
+    if out is None:
+        out = sys.stdout
+    first = True
+    out.write("{")
+    for name, FS in named:
+        out.write("\n" if first else ",\n")
+        first = False
+        out.write("\t{}: ".format(json.dumps(name, ensure_ascii=False)))
+        with _stats.phase("sort"):
+            items = sorted(FS.items(), key=order)
+        for line in stream(items, 2):
+            out.write(line)
+    out.write("}\n" if first else "\n}\n")
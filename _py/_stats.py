@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import atexit
+from collections import OrderedDict
+import os
+import sys
+import time
+
+# Phase timers and counters for the scripts, off unless asked for:
+#
+#   --timing[=FILE]   or PSO2ES_TIMING=FILE      a JSON report at exit, one
+#                                                line per script, "-" or no
+#                                                FILE for stderr
+#   --profile[=FILE]  or PSO2ES_PROFILE=FILE     cProfile stats, a folder
+#                                                gets one file per script
+#   --tracemalloc     or PSO2ES_TRACEMALLOC=1    the Python heap peak
+#
+# The flags are taken out of sys.argv when this is first imported, before
+# the scripts look at their arguments.
+
+timing = os.environ.get("PSO2ES_TIMING")
+profile = os.environ.get("PSO2ES_PROFILE")
+trace = bool(os.environ.get("PSO2ES_TRACEMALLOC"))
+
+phases = OrderedDict()
+counters = OrderedDict()
+enabled = False
+script = None
+started = 0
+profiler = None
+
+
+class _Phase(object):
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        p = phases.get(self.name)
+        if p is None:
+            p = phases[self.name] = [0.0, 0]
+        p[0] += time.perf_counter() - self.start
+        p[1] += 1
+        return False
+
+
+class _Nothing(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_nothing = _Nothing()
+
+
+def phase(name):
+    """Time a block: with _stats.phase("parse"): ...
+
+    Phases add up over every time they are entered, and can be nested.
+    """
+    if not enabled:
+        return _nothing
+    return _Phase(name)
+
+
+def count(name, n=1):
+    if enabled:
+        counters[name] = counters.get(name, 0) + n
+
+
+def snapshot():
+    """What a pool worker has counted so far, see since()."""
+    if not enabled:
+        return None
+    return dict((k, list(v)) for k, v in phases.items()), dict(counters)
+
+
+def since(before):
+    """What was counted after snapshot(), to send back to the parent."""
+    if before is None:
+        return None
+    bphases, bcounters = before
+    return (
+        dict((k, (v[0] - bphases.get(k, (0.0, 0))[0], v[1] - bphases.get(k, (0.0, 0))[1])) for k, v in phases.items()),
+        dict((k, v - bcounters.get(k, 0)) for k, v in counters.items()),
+    )
+
+
+def merge(delta):
+    """Add what a pool worker counted."""
+    if delta is None:
+        return
+    dphases, dcounters = delta
+    for k, (s, n) in dphases.items():
+        p = phases.get(k)
+        if p is None:
+            p = phases[k] = [0.0, 0]
+        p[0] += s
+        p[1] += n
+    for k, n in dcounters.items():
+        count(k, n)
+
+
+def flags(argv):
+    """Take the flags out of argv."""
+    global timing
+    global profile
+    global trace
+    rest = list()
+    for a in argv:
+        if a == "--timing":
+            timing = "-"
+        elif a.startswith("--timing="):
+            timing = a[9:]
+        elif a == "--profile":
+            profile = "pso2es.prof"
+        elif a.startswith("--profile="):
+            profile = a[10:]
+        elif a == "--tracemalloc":
+            trace = True
+        else:
+            rest.append(a)
+    argv[:] = rest
+
+
+def reset(name=None):
+    """Start counting for a script, name defaults to the running one."""
+    global enabled
+    global script
+    global started
+    global profiler
+    phases.clear()
+    counters.clear()
+    enabled = bool(timing or profile or trace)
+    script = name or os.path.basename(sys.argv[0])
+    started = time.perf_counter()
+    if profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    if trace:
+        import tracemalloc
+        tracemalloc.start()
+
+
+def report():
+    """Return what was counted as a dict."""
+    r = OrderedDict()
+    r["script"] = script
+    r["argv"] = sys.argv[1:]
+    r["seconds"] = time.perf_counter() - started
+    r["phases"] = OrderedDict(
+        (k, {"seconds": v[0], "calls": v[1]}) for k, v in phases.items())
+    r["counters"] = OrderedDict(counters)
+    if trace:
+        import tracemalloc
+        if tracemalloc.is_tracing():
+            r["heap_peak_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+    try:
+        import resource
+        r["maxrss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        pass
+    return r
+
+
+def finish():
+    """Write the report and the profile of the script that just ran."""
+    global enabled
+    global profiler
+    if not enabled:
+        return
+    enabled = False
+    if profiler is not None:
+        profiler.disable()
+        path = profile
+        if os.path.isdir(path):
+            path = os.path.join(path, os.path.splitext(script)[0] + ".prof")
+        profiler.dump_stats(path)
+        profiler = None
+    r = report()
+    if trace:
+        import tracemalloc
+        tracemalloc.stop()
+    if timing:
+        import json
+        line = json.dumps(r, ensure_ascii=False)
+        if timing == "-":
+            sys.stderr.write(line + "\n")
+        else:
+            with open(timing, "a") as out:
+                out.write(line + "\n")
+
+
+flags(sys.argv)
+reset()
+atexit.register(finish)
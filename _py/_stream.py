@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import json
+import re
+
+# Read only some fields of the entries of a JSON file, without making a
+# dict of every entry.
+#
+# The files are written by json.dump with indent="\t", so an entry starts
+# with a line of a tab and "{", and its fields are the lines starting with
+# two tabs and their name in quotes. A text cannot hold a line break, so a
+# regex over the raw bytes finds those lines, and only the values wanted are
+# decoded, all in one json.loads. Files written any other way are read with
+# json.loads.
+
+_scanners = dict()
+
+# Told apart from a null
+_missing = object()
+
+
+def _scanner(fields):
+    scanner = _scanners.get(fields)
+    if scanner is None:
+        names = b"|".join(re.escape(json.dumps(field, ensure_ascii=False)[1:-1].encode("utf-8")) for field in fields)
+        scanner = re.compile(b'\n\t(?:(\\{)|\t"(' + names + b')": ([^\n]*))')
+        _scanners[fields] = scanner
+    return scanner
+
+
+def _tabbed(raw):
+    """Is it a list of entries as json.dump writes it with tabs?"""
+    return raw.startswith(b"[\n\t{") or raw.strip() == b"[]"
+
+
+def _rows(raw, fields):
+    """Return a list of the fields of every entry, _missing where there is none."""
+    if not _tabbed(raw):
+        return [[entry.get(field, _missing) for field in fields] for entry in json.loads(raw.decode("utf-8"))]
+    where = dict((field.encode("utf-8"), n) for n, field in enumerate(fields))
+    rows = list()
+    empty = [_missing] * len(fields)
+    row = None
+    slots = list()
+    values = list()
+    for m in _scanner(fields).finditer(raw):
+        entry, field, value = m.groups()
+        if entry:
+            row = empty[:]
+            rows.append(row)
+            continue
+        if value in (b"[", b"{"):
+            # A list or an object, up to its closing line
+            end = raw.index(b"\n\t\t" + (b"]" if value == b"[" else b"}"), m.end()) + 4
+            value = raw[m.start(3):end]
+        elif value.endswith(b","):
+            value = value[:-1]
+        # The last one wins, as with json.loads
+        slots.append((row, where[field]))
+        values.append(value)
+    for (row, n), value in zip(slots, json.loads(b"[" + b",".join(values) + b"]")):
+        row[n] = value
+    return rows
+
+
+def read(filename):
+    with open(filename, mode='rb') as json_file:
+        return json_file.read()
+
+
+def project(filename, fields):
+    """Yield a tuple of the fields of every entry, None for the missing ones."""
+    fields = tuple(fields)
+    for row in _rows(read(filename), fields):
+        yield tuple(None if value is _missing else value for value in row)
+
+
+def load(filename, fields):
+    """Return the entries as dicts of only the fields they have.
+
+    Every entry is there, so the indexes are those of json.load.
+    """
+    fields = tuple(fields)
+    return [
+        dict((field, value) for field, value in zip(fields, row) if value is not _missing)
+        for row in _rows(read(filename), fields)
+    ]
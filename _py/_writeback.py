@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _stats
+import atexit
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import platform
+import sys
+import threading
+import time
+
+# The files a run changes are written together when it ends, so a crash or
+# a Ctrl-C halfway leaves every file as it was:
+#
+#   every file goes to a .tmp next to it first, in parallel, and is synced
+#   the journal gets what the files were and what they become
+#   the .tmp files are renamed over the files, and their folders synced
+#
+# A run that ends with an exception writes nothing. The journal and what
+# the files were before are kept in the .writeback folder next to the json
+# folder, by their git blob hash, for the last runs:
+#
+#   ./_py/undo.py [--list] [--force]
+#
+# puts back the files of the last run.
+
+# The runs kept in the journal
+keep = 20
+
+pending = OrderedDict()
+failed = False
+registered = False
+
+
+def blob(data):
+    """The git blob hash of the data."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def folder(filename):
+    """The .writeback folder of a file, next to the folder it is in."""
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(filename))), ".writeback")
+
+
+def _excepthook(kind, value, traceback):
+    global failed
+    failed = True
+    _previous(kind, value, traceback)
+
+
+_previous = sys.excepthook
+
+
+def put(filename, data):
+    """Write data (str or bytes) to filename when the run ends."""
+    global registered
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if not registered:
+        # After the _stats report is set up, so it counts the writing
+        registered = True
+        sys.excepthook = _excepthook
+        atexit.register(_exit)
+    pending[os.path.abspath(filename)] = data
+
+
+def get(filename):
+    """What filename gets when the run ends, None if nothing."""
+    return pending.get(os.path.abspath(filename))
+
+
+def discard():
+    pending.clear()
+
+
+def _exit():
+    if failed:
+        if pending:
+            print("Not writing {} files, the run failed".format(len(pending)), file=sys.stderr)
+        discard()
+        return
+    commit()
+
+
+def read(filename):
+    try:
+        with open(filename, mode='rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _sync(f):
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _stage(item):
+    """Write a file's .tmp and sync it."""
+    filename, data = item
+    tmp = filename + ".tmp"
+    with open(tmp, mode='wb') as f:
+        f.write(data)
+        _sync(f)
+    return tmp
+
+
+def _parallel(func, items):
+    """[func(item) for item in items], in threads.
+
+    Not a ThreadPoolExecutor, which takes no work once the interpreter
+    shuts down, and the files are written from atexit.
+    """
+    results = [None] * len(items)
+    errors = list()
+    todo = iter(enumerate(items))
+    lock = threading.Lock()
+
+    def work():
+        while True:
+            with lock:
+                n, item = next(todo, (None, None))
+            if n is None:
+                return
+            try:
+                results[n] = func(item)
+            except BaseException as e:
+                errors.append(e)
+                return
+
+    threads = [threading.Thread(target=work) for i in range(min(len(items), os.cpu_count() or 1))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        for tmp in results:
+            if tmp is not None:
+                os.remove(tmp)
+        raise errors[0]
+    return results
+
+
+def _syncdir(path):
+    if platform.system() == 'Windows':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def commit(journal=True):
+    """Write the pending files, return how many changed."""
+    with _stats.phase("write"):
+        changes = list()
+        for filename, data in pending.items():
+            old = read(filename)
+            if old != data:
+                changes.append((filename, old, data))
+        pending.clear()
+        if not changes:
+            return 0
+        tmps = _parallel(_stage, [(filename, data) for filename, old, data in changes])
+        try:
+            if journal:
+                record(changes)
+        except BaseException:
+            for tmp in tmps:
+                os.remove(tmp)
+            raise
+        for (filename, old, data), tmp in zip(changes, tmps):
+            os.replace(tmp, filename)
+        for path in set(os.path.dirname(filename) for filename, old, data in changes):
+            _syncdir(path)
+    _stats.count("written", len(changes))
+    return len(changes)
+
+
+def record(changes):
+    """Keep what the files were, and add the run to the journal."""
+    folders = OrderedDict()
+    for filename, old, data in changes:
+        folders.setdefault(folder(filename), list()).append((filename, old, data))
+    for path, files in folders.items():
+        objects = os.path.join(path, "objects")
+        os.makedirs(objects, exist_ok=True)
+        entry = OrderedDict()
+        entry["time"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        entry["argv"] = sys.argv
+        entry["files"] = list()
+        root = os.path.dirname(path)
+        for filename, old, data in files:
+            before = None
+            if old is not None:
+                before = blob(old)
+                kept = os.path.join(objects, before)
+                if not os.path.exists(kept):
+                    with open(kept + ".tmp", mode='wb') as f:
+                        f.write(old)
+                        _sync(f)
+                    os.replace(kept + ".tmp", kept)
+            entry["files"].append([os.path.relpath(filename, root).replace(os.sep, "/"), before, blob(data)])
+        with open(os.path.join(path, "journal"), mode='ab') as f:
+            f.write((json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8"))
+            _sync(f)
+        prune(path)
+
+
+def runs(path):
+    """The runs in the journal of a .writeback folder, oldest first."""
+    data = read(os.path.join(path, "journal"))
+    if data is None:
+        return list()
+    return [json.loads(line) for line in data.decode("utf-8").splitlines() if line.strip()]
+
+
+def save(path, entries):
+    """Write the journal, and drop what none of its runs needs."""
+    journal = os.path.join(path, "journal")
+    with open(journal + ".tmp", mode='wb') as f:
+        f.write("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries).encode("utf-8"))
+        _sync(f)
+    os.replace(journal + ".tmp", journal)
+    needed = set(before for e in entries for name, before, after in e["files"])
+    objects = os.path.join(path, "objects")
+    if not os.path.isdir(objects):
+        return
+    for name in os.listdir(objects):
+        if name not in needed:
+            os.remove(os.path.join(objects, name))
+
+
+def prune(path):
+    entries = runs(path)
+    if len(entries) > keep:
+        save(path, entries[-keep:])
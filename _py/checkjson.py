@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import _jsonio
+import _manifest
+import _stats
 import codecs
-import fnmatch
-import json
-import os
 import sys
 
 counterr = 0
@@ -15,16 +15,13 @@ if len(sys.argv) < 2:
 else:
     dir = sys.argv[1]
 
-json_files = [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, '*.txt')
-]
+json_files = _manifest.files(dir, "json")
 for files in json_files:
     with codecs.open(files, mode='r', encoding='utf-8') as json_file:
         try:
             countin = 0
-            djson = json.load(json_file)
+            with _stats.phase("parse"):
+                djson = _jsonio.load(json_file)
             for rmid in djson:
                 countin += 1
             if (countin == 0):
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _checker
+import _manifest
+import _stats
+import argparse
+from collections import OrderedDict
+import difflib
+import fnmatch
+import numpy
+import os
+import re
+import search
+import sys
+import unicodedata
+
+# Group the JP texts that are nearly the same, the ones that differ by a
+# colour, a number or a name, so a group can be translated in one go.
+#
+#   ./_py/cluster.py [jsondir] [--field jp_text] [--files 'Item_*']
+#                    [--threshold 0.7] [--min 2] [--limit 50] [--untranslated]
+#
+# Every text is cut into the runs of three characters it has, and two texts
+# are as close as the share of the runs they have in common. The texts are
+# not compared pair by pair: each one gets a short signature of the
+# smallest hash of its runs under 64 hashes (MinHash), and only the texts
+# with one band of 4 of those in common are compared (LSH). Every group is
+# printed as the text its members share with {} where they differ, then
+# what every member has there, an * before the untranslated ones.
+
+# The runs of characters compared
+shingle = 3
+# The hashes of a signature, as bands of rows
+bands = 16
+rows = 4
+
+
+def fold(text):
+    return unicodedata.normalize("NFKC", text)
+
+
+def collect(dir, field=None, files=None):
+    """Return an OrderedDict of every JP text to where it is.
+
+    A place is (file, entry, where, field, item, translated).
+    """
+    texts = OrderedDict()
+    for filename in _manifest.files(dir, "json"):
+        f = os.path.splitext(os.path.basename(filename))[0]
+        if files is not None and not fnmatch.fnmatch(f, files) and not fnmatch.fnmatch(f + ".txt", files):
+            continue
+        djson = _checker.load(filename)
+        for e, entry in enumerate(djson):
+            for name, value in entry.items():
+                if not name.startswith("jp_"):
+                    continue
+                if field is not None and field not in (name, name[3:], "tr_" + name[3:]):
+                    continue
+                values = enumerate(value) if isinstance(value, list) else [(-1, value)]
+                for k, t in values:
+                    if not isinstance(t, str) or t.strip() == "":
+                        continue
+                    texts.setdefault(t, list()).append(
+                        (f, e, _checker.where(entry, e), name, k, search.translated(entry, "tr_" + name[3:], k)))
+    return texts
+
+
+def signatures(texts):
+    """The MinHash signature of every text, one row each."""
+    # Every text and two NULs after it as UTF-32, the runs starting on a NUL
+    # are not the text's
+    joined = "".join(fold(t) + "\0" * (shingle - 1) for t in texts)
+    codes = numpy.frombuffer(joined.encode("utf-32-le"), dtype=numpy.uint32).astype(numpy.uint64)
+    runs = codes[:len(codes) - shingle + 1].copy()
+    for n in range(1, shingle):
+        runs = (runs << numpy.uint64(21)) | codes[n:len(codes) - shingle + 1 + n]
+    runs = runs[codes[:len(codes) - shingle + 1] != 0]
+    lengths = numpy.array([len(fold(t)) for t in texts], dtype=numpy.int64)
+    starts = numpy.concatenate(([0], numpy.cumsum(lengths)[:-1]))
+    # Multiply and shift hashes, the top 32 bits of a * x + b
+    rng = numpy.random.default_rng(0)
+    a = rng.integers(1, 2 ** 63, size=bands * rows, dtype=numpy.uint64) | numpy.uint64(1)
+    b = rng.integers(0, 2 ** 63, size=bands * rows, dtype=numpy.uint64)
+    sig = numpy.empty((len(texts), bands * rows), dtype=numpy.uint32)
+    with numpy.errstate(over="ignore"):
+        for n in range(bands * rows):
+            hashes = ((runs * a[n] + b[n]) >> numpy.uint64(32)).astype(numpy.uint32)
+            sig[:, n] = numpy.minimum.reduceat(hashes, starts)
+    return sig
+
+
+def candidates(sig):
+    """Return the pairs of texts with a band in common, as two arrays.
+
+    Every text of a bucket is paired with its first one only, which keeps
+    the pairs linear in the texts.
+    """
+    left = list()
+    right = list()
+    with numpy.errstate(over="ignore"):
+        for band in range(bands):
+            key = numpy.zeros(len(sig), dtype=numpy.uint64)
+            for n in range(band * rows, (band + 1) * rows):
+                key = key * numpy.uint64(0x100000001B3) + sig[:, n].astype(numpy.uint64)
+            order = numpy.argsort(key, kind="stable")
+            sorted_keys = key[order]
+            first = numpy.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+            leader = order[numpy.maximum.accumulate(numpy.where(first, numpy.arange(len(order)), 0))]
+            pair = ~first
+            left.append(leader[pair])
+            right.append(order[pair])
+    return numpy.concatenate(left), numpy.concatenate(right)
+
+
+def clusters(texts, threshold):
+    """Return the groups of near duplicate texts, as lists of indexes."""
+    with _stats.phase("minhash"):
+        sig = signatures(texts)
+    with _stats.phase("lsh"):
+        left, right = candidates(sig)
+        # The share of equal hashes is about the share of runs in common
+        close = (sig[left] == sig[right]).mean(axis=1) >= threshold
+        left = left[close].tolist()
+        right = right[close].tolist()
+    parent = list(range(len(texts)))
+
+    def root(n):
+        while parent[n] != n:
+            parent[n] = parent[parent[n]]
+            n = parent[n]
+        return n
+
+    for x, y in zip(left, right):
+        x = root(x)
+        y = root(y)
+        if x != y:
+            parent[max(x, y)] = min(x, y)
+    groups = OrderedDict()
+    for n in range(len(texts)):
+        groups.setdefault(root(n), list()).append(n)
+    _stats.count("pairs", len(left))
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def template(members):
+    """Return what the texts have in common, {} where they differ."""
+    common = list(members[0])
+    for text in members[1:]:
+        blocks = difflib.SequenceMatcher(None, common, text, autojunk=False).get_matching_blocks()
+        kept = list()
+        at = 0
+        for i, j, n in blocks:
+            if i > at and (not kept or kept[-1] is not None):
+                kept.append(None)
+            kept.extend(common[i:i + n])
+            at = i + n
+        if at < len(common) and (not kept or kept[-1] is not None):
+            kept.append(None)
+        common = kept
+    out = ""
+    for c in common:
+        if c is None:
+            out += "{}"
+        else:
+            out += c
+    return out
+
+
+def differences(pattern, text):
+    """What a text has where the template has {}."""
+    parts = pattern.split("{}")
+    found = re.match("(.*?)".join(re.escape(part) for part in parts) + "$", text, re.S)
+    if found is None or len(parts) == 1:
+        return ""
+    return " | ".join(value or "-" for value in found.groups())
+
+
+def oneline(text):
+    return text.replace("\r\n", "\\n").replace("\n", "\\n")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Group the JP texts that are nearly the same")
+    parser.add_argument("dir", nargs="?", default="json")
+    parser.add_argument("--field", help="only this field, like jp_text or explain")
+    parser.add_argument("--files", help="only the files matching this glob, like 'Item_*'")
+    parser.add_argument("--threshold", type=float, default=0.7, help="how close the texts of a group are, from 0 to 1")
+    parser.add_argument("--min", type=int, default=2, help="the fewest texts in a group")
+    parser.add_argument("--limit", type=int, default=50, help="at most this many groups, 0 for all")
+    parser.add_argument("--untranslated", action="store_true", help="only the groups with untranslated texts")
+    args = parser.parse_args()
+
+    texts = collect(args.dir, args.field, args.files)
+    keys = list(texts)
+    if not keys:
+        sys.exit("No texts found")
+    groups = clusters(keys, args.threshold)
+    groups = [group for group in groups if len(group) >= args.min]
+    if args.untranslated:
+        groups = [group for group in groups if any(not p[5] for n in group for p in texts[keys[n]])]
+    # The biggest groups first
+    groups.sort(key=lambda group: (-len(group), group[0]))
+
+    shown = groups if not args.limit else groups[:args.limit]
+    with _stats.phase("report"):
+        for group in shown:
+            members = [keys[n] for n in group]
+            places = [p for t in members for p in texts[t]]
+            pattern = template(members)
+            print("{} texts in {} places, {} untranslated: {}".format(
+                len(members), len(places), sum(1 for p in places if not p[5]), oneline(pattern)))
+            for t in members:
+                f, e, at, name, k, done = texts[t][0]
+                if k >= 0:
+                    name = "{}[{}]".format(name, k)
+                more = " (+{})".format(len(texts[t]) - 1) if len(texts[t]) > 1 else ""
+                print("  {}{} {} {} {}{}".format(
+                    " " if done else "*", oneline(differences(pattern, t)), f, at, name, more))
+    if len(shown) < len(groups):
+        print("... {} more groups".format(len(groups) - len(shown)))
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import _jsonio
+import _manifest
+import _stats
 import codecs
-import fnmatch
-import json
-import os
+import leftover
 import re
 import sys
 
@@ -13,24 +14,27 @@ counterr = 0
 bufout = "000.0%\t0FILE"
 invalid_json_files = []
 
+# With --dirty, count the translated texts that still have Japanese in them
+args = [a for a in sys.argv[1:] if a != "--dirty"]
+showdirty = len(args) < len(sys.argv) - 1
+
 # Need the json path
-if len(sys.argv) < 2:
+if len(args) < 1:
     dir = "json"
 else:
-    dir = sys.argv[1]
+    dir = args[0]
 
-json_files = [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, '*.txt')
-]
+json_files = _manifest.files(dir, "json")
 
 for files in json_files:
     with codecs.open(files, mode='r', encoding='utf-8') as json_file:
         try:
             countin = 0
             countout = 0
-            djson = json.load(json_file)
+            # Translated but with Japanese left
+            countdirty = 0
+            with _stats.phase("parse"):
+                djson = _jsonio.load(json_file)
             linenames = ["text", "name", "title", "explain", "explainShort", "explainLong", "patterns"]
             for rmid in djson:
                 for checkname in linenames:
@@ -52,11 +56,17 @@ for files in json_files:
 
                         if((checktr in rmid) and (rmid[checktr] != "") and (rmid[checktr] != rmid[checkjp])):
                             countout += 1
+                            texts = rmid[checktr] if isinstance(rmid[checktr], list) else [rmid[checktr]]
+                            if showdirty and any(isinstance(t, str) and leftover.dirty(t) for t in texts):
+                                countdirty += 1
 
             # print ("%s/%s" % (countin, countout))
             if (countin):
                 countper = "{:06.2%}".format(float(countout) / float(countin))
-                bufout += '\n{0}\t{1} ({2}/{3})'.format(countper, files, countout, countin)
+                if countdirty:
+                    bufout += '\n{0}\t{1} ({2}/{3}, {4} dirty)'.format(countper, files, countout, countin, countdirty)
+                else:
+                    bufout += '\n{0}\t{1} ({2}/{3})'.format(countper, files, countout, countin)
             else:
                 bufout += '\n{0}\t:{1}'.format("No translatable lines found ", files)
         except ValueError as e:
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import _jsonio
+import _manifest
+import _stats
 import codecs
-import fnmatch
-import json
 import os
 import sys
 import unicodedata
@@ -21,34 +22,13 @@ if len(sys.argv) < 2:
 else:
     dir = sys.argv[1]
 
-json_files = [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'Item_*.txt')
-]
-
-json_files += [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'Explain_SkillRing.txt')
-]
-
-json_files += [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'Explain_System.txt')
-]
-
-json_files += [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'Items_Leftovers.txt')
-]
+json_files = _manifest.files(dir, "item_map")
 
 for files in json_files:
     with codecs.open(files, mode='r', encoding='utf-8') as json_file:
         try:
-            djson = json.load(json_file)
+            with _stats.phase("parse"):
+                djson = _jsonio.load(json_file)
             for rmid in djson:
                 if (("tr_text" in rmid) and (rmid["tr_text"] != "")):
                     t = rmid["tr_text"]
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _checker
+import _jsonio
+import _manifest
+import _stats
+import hashlib
+import os
+import search
+import sqlite3
+import sys
+
+# Mirror the json folder into a SQLite database, to look at the texts with
+# SQL instead of another script.
+#
+#   ./_py/exportdb.py [jsondir] [pso2es.sqlite] [--rebuild]
+#
+# texts has one row per file, entry, field and list item, with the JP and
+# the TR side of the field next to each other. jp_fts and tr_fts are FTS5
+# tables over them, the JP one by trigrams so any part of a word is found:
+#
+#   SELECT file, at, tr FROM texts
+#   WHERE id IN (SELECT rowid FROM jp_fts WHERE jp_fts MATCH 'フォトン');
+#
+# Every run only reads the files whose size, time and hash changed since the
+# last one, and updates them in one transaction.
+
+schema = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    entries INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS texts (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    entry INTEGER NOT NULL,
+    at TEXT NOT NULL,
+    field TEXT NOT NULL,
+    item INTEGER NOT NULL,
+    jp TEXT,
+    tr TEXT,
+    translated INTEGER NOT NULL,
+    UNIQUE (file, entry, field, item)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS jp_fts USING fts5(jp, content='texts', content_rowid='id', tokenize='{}');
+CREATE VIRTUAL TABLE IF NOT EXISTS tr_fts USING fts5(tr, content='texts', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS texts_insert AFTER INSERT ON texts BEGIN
+    INSERT INTO jp_fts (rowid, jp) VALUES (new.id, new.jp);
+    INSERT INTO tr_fts (rowid, tr) VALUES (new.id, new.tr);
+END;
+CREATE TRIGGER IF NOT EXISTS texts_delete AFTER DELETE ON texts BEGIN
+    INSERT INTO jp_fts (jp_fts, rowid, jp) VALUES ('delete', old.id, old.jp);
+    INSERT INTO tr_fts (tr_fts, rowid, tr) VALUES ('delete', old.id, old.tr);
+END;
+CREATE VIEW IF NOT EXISTS progress AS
+    SELECT file, field, COUNT(*) AS texts, SUM(translated) AS translated,
+        ROUND(100.0 * SUM(translated) / COUNT(*), 2) AS percent
+    FROM texts WHERE jp IS NOT NULL AND jp != '' GROUP BY file, field;
+"""
+
+
+def tokenizer():
+    """Trigrams for the JP text, from SQLite 3.34 on."""
+    if sqlite3.sqlite_version_info >= (3, 34, 0):
+        return "trigram"
+    return "unicode61"
+
+
+def connect(filename):
+    db = sqlite3.connect(filename, isolation_level=None)
+    db.executescript(schema.format(tokenizer()))
+    return db
+
+
+def rows(f, djson):
+    """Yield a texts row for every jp_/tr_ field of every entry."""
+    for e, entry in enumerate(djson):
+        fields = list()
+        for field in entry:
+            if field.startswith(("jp_", "tr_")) and field[3:] not in fields:
+                fields.append(field[3:])
+        if not fields:
+            continue
+        at = _checker.where(entry, e)
+        for field in fields:
+            j = entry.get("jp_" + field)
+            t = entry.get("tr_" + field)
+            if isinstance(j, list) or isinstance(t, list):
+                j = j if isinstance(j, list) else list()
+                t = t if isinstance(t, list) else list()
+                for k in range(max(len(j), len(t))):
+                    jk = j[k] if k < len(j) else None
+                    tk = t[k] if k < len(t) else None
+                    yield f, e, at, field, k, jk, tk, search.translated(entry, "tr_" + field, k)
+            else:
+                yield f, e, at, field, -1, j, t, search.translated(entry, "tr_" + field, -1)
+
+
+def sync(dir, filename, rebuild=False):
+    """Bring the database up to date with dir, return the files updated."""
+    if rebuild and os.path.exists(filename):
+        # Quicker than deleting every row
+        os.remove(filename)
+    db = connect(filename)
+    updated = list()
+    db.execute("BEGIN")
+    try:
+        known = dict((name, (size, mtime, digest)) for name, size, mtime, digest in db.execute(
+            "SELECT name, size, mtime_ns, hash FROM files"))
+        names = _manifest.files(dir, "json")
+        for name in names:
+            f = os.path.splitext(os.path.basename(name))[0]
+            st = os.stat(name)
+            old = known.get(f)
+            if old is not None and old[:2] == (st.st_size, st.st_mtime_ns):
+                continue
+            with open(name, "rb") as j:
+                raw = j.read()
+            digest = hashlib.sha1(raw).hexdigest()
+            if old is not None and old[2] == digest:
+                db.execute("UPDATE files SET size = ?, mtime_ns = ? WHERE name = ?", (st.st_size, st.st_mtime_ns, f))
+                continue
+            try:
+                with _stats.phase("parse"):
+                    djson = _jsonio.loads(raw)
+            except ValueError as e:
+                print("{}: {}".format(name, e), file=sys.stderr)
+                continue
+            with _stats.phase("write"):
+                db.execute("DELETE FROM texts WHERE file = ?", (f,))
+                db.executemany(
+                    "INSERT INTO texts (file, entry, at, field, item, jp, tr, translated) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows(f, djson))
+                db.execute(
+                    "INSERT OR REPLACE INTO files (name, size, mtime_ns, hash, entries) VALUES (?, ?, ?, ?, ?)",
+                    (f, st.st_size, st.st_mtime_ns, digest, len(djson)))
+            updated.append(f)
+        gone = set(known) - set(os.path.splitext(os.path.basename(name))[0] for name in names)
+        for f in gone:
+            db.execute("DELETE FROM texts WHERE file = ?", (f,))
+            db.execute("DELETE FROM files WHERE name = ?", (f,))
+            updated.append(f)
+        db.execute("COMMIT")
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    finally:
+        db.close()
+    _stats.count("synced", len(updated))
+    return updated
+
+
+if __name__ == '__main__':
+    rebuild = "--rebuild" in sys.argv
+    args = [a for a in sys.argv[1:] if a != "--rebuild"]
+
+    # Need the json path
+    if len(args) < 1:
+        dir = "json"
+    else:
+        dir = args[0]
+    if len(args) < 2:
+        filename = "pso2es.sqlite"
+    else:
+        filename = args[1]
+
+    updated = sync(dir, filename, rebuild)
+    print("Updated {} files in {}".format(len(updated), filename))
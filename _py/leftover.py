@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _checker
+import _manifest
+import multiprocessing as mp
+import os
+import re
+import sys
+
+# Look for Japanese left in the translations: kana and kanji in any
+# translated tr_ text. Japanese punctuation, the ideographic space and full
+# width forms are left alone, the translations use them on purpose.
+#
+#   ./_py/leftover.py [jsondir]
+#
+# coverage.py --dirty counts these texts as translated but dirty.
+
+# The characters looked for
+ranges = [
+    (0x3005, 0x3006),  # Iteration and closing marks 々〆
+    (0x3040, 0x30FF),  # Kana
+    (0x31F0, 0x31FF),
+    (0xFF66, 0xFF9F),  # Half width katakana
+    (0x3400, 0x4DBF),  # Kanji
+    (0x4E00, 0x9FFF),
+    (0xF900, 0xFAFF),
+]
+
+# The symbols used on purpose in the translations. The middle dot is cut out
+# of the kana block, the others are outside the ranges and stay allowed if
+# the ranges grow.
+allowed = "・★☆※＊①②③④⑤⑥⑦⑧⑨⑩"
+
+
+def charclass(ranges, allowed):
+    """A regex character class of the ranges without the allowed characters."""
+    cut = sorted(ord(c) for c in set(allowed))
+    parts = list()
+    for first, last in ranges:
+        for o in cut:
+            if first <= o <= last:
+                if first < o:
+                    parts.append((first, o - 1))
+                first = o + 1
+        if first <= last:
+            parts.append((first, last))
+    return "[" + "".join(
+        re.escape(chr(first)) + ("-" + re.escape(chr(last)) if last > first else "") for first, last in parts) + "]"
+
+
+japanese = re.compile(charclass(ranges, allowed))
+
+
+def dirty(text):
+    """Is any Japanese left in the text?"""
+    return japanese.search(text) is not None
+
+
+def left(text):
+    """The Japanese characters left in the text, once each."""
+    return "".join(sorted(set(japanese.findall(text)), key=text.index))
+
+
+def scan(djson, start=0):
+    """Return (entry, field, item) for the translated texts with Japanese left."""
+    found = list()
+    for n, entry in enumerate(djson, start):
+        for field in entry:
+            if not field.startswith("tr_"):
+                continue
+            for e, k, t in _checker.texts({"field": field}, [entry], n):
+                if dirty(t):
+                    found.append((e, field, k))
+    return found
+
+
+def check(job):
+    filename, part, parts = job
+    djson = _checker.load(filename)
+    start, stop = _checker.bounds(len(djson), part, parts)
+    return scan(djson[start:stop], start)
+
+
+if __name__ == '__main__':
+    mp.freeze_support()
+    # error counter
+    counterr = 0
+
+    # Need the json path
+    if len(sys.argv) < 2:
+        dir = "json"
+    else:
+        dir = sys.argv[1]
+
+    filenames = _manifest.files(dir, "json")
+    jobs = _checker.plan(filenames, os.cpu_count() or 1)
+    results = dict((filename, list()) for filename in filenames)
+    for job, result in zip(jobs, _checker.schedule(check, jobs)):
+        results[job[0]].extend(result)
+
+    for filename in filenames:
+        if not results[filename]:
+            continue
+        f = os.path.splitext(os.path.basename(filename))[0]
+        djson = _checker.load(filename)
+        for e, field, k in sorted(results[filename]):
+            t = _checker.text({"field": field}, djson[e], k)
+            if k >= 0:
+                field = "{}[{}]".format(field, k)
+            print("{} {} {}: '{}' has Japanese left: {}".format(
+                f, _checker.where(djson[e], e), field, t.replace("\r\n", "\\r\\n").replace("\n", "\\n"), left(t)))
+            counterr += 1
+
+    if counterr > 0:
+        sys.exit("Issues found")
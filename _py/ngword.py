@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _checker
+import _manifest
+import _matcher
+import multiprocessing as mp
+import os
+import sys
+import unicodedata
+
+# Look for the words of the game's NGWord_* lists in the translations, the
+# game would hide them behind asterisks.
+#
+#   ./_py/ngword.py [jsondir]
+#
+# Every NG word goes into one matcher, so each text is read once however
+# many words there are. The words and the texts are both NFKC normalized,
+# case folded and have their katakana turned into hiragana, so "ＳＥＧＡ",
+# "sega" and "セガ" are all the same. The NGWord_Name_* words are only
+# looked for in the tr_name fields.
+#
+# The English words only count as whole words, or "con" would be found in
+# every "continue".
+
+# Katakana to hiragana
+kana = dict((c, c - 0x60) for c in range(ord("ァ"), ord("ヶ") + 1))
+
+words = _matcher.Matcher()
+names = _matcher.Matcher()
+
+
+def fold(text):
+    return unicodedata.normalize("NFKC", text).casefold().translate(kana)
+
+
+def prepare(dir):
+    """Put the words of the lists into the matchers."""
+    global words
+    global names
+    words = _matcher.Matcher()
+    names = _matcher.Matcher()
+    for group, matcher in (("ngword", words), ("ngname", names)):
+        for filename in _manifest.files(dir, group):
+            for entry in _checker.load(filename):
+                w = entry.get("text", "")
+                if w.strip() != "":
+                    matcher.add(fold(w), w)
+    words.build()
+    names.build()
+
+
+def hits(matcher, text):
+    """Return the NG words in a folded text."""
+    found = set()
+    for start, end, value in matcher.find(text):
+        if value.isascii():
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end < len(text) and text[end].isalnum():
+                continue
+        found.add(value)
+    return found
+
+
+def scan(djson, start=0):
+    """Return (entry, field, item, NG words) for the texts with any."""
+    found = list()
+    for n, entry in enumerate(djson, start):
+        for field, value in entry.items():
+            if not field.startswith("tr_"):
+                continue
+            rule = {"field": field}
+            for e, k, t in _checker.texts(rule, [entry], n):
+                f = fold(t)
+                ng = hits(words, f)
+                if field == "tr_name":
+                    ng |= hits(names, f)
+                if ng:
+                    found.append((e, field, k, sorted(ng)))
+    return found
+
+
+def check(job):
+    filename, part, parts = job
+    djson = _checker.load(filename)
+    start, stop = _checker.bounds(len(djson), part, parts)
+    return scan(djson[start:stop], start)
+
+
+if __name__ == '__main__':
+    mp.freeze_support()
+    # error counter
+    counterr = 0
+
+    # Need the json path
+    if len(sys.argv) < 2:
+        dir = "json"
+    else:
+        dir = sys.argv[1]
+
+    # The matchers are made before the workers start, they get a copy
+    prepare(dir)
+    lists = set(_manifest.files(dir, "ngword", "ngname"))
+    filenames = [f for f in _manifest.files(dir, "json") if f not in lists]
+    jobs = _checker.plan(filenames, os.cpu_count() or 1)
+    results = dict((filename, list()) for filename in filenames)
+    for job, result in zip(jobs, _checker.schedule(check, jobs)):
+        results[job[0]].extend(result)
+
+    for filename in filenames:
+        if not results[filename]:
+            continue
+        f = os.path.splitext(os.path.basename(filename))[0]
+        djson = _checker.load(filename)
+        for e, field, k, ng in sorted(results[filename]):
+            t = _checker.text({"field": field}, djson[e], k)
+            if k >= 0:
+                field = "{}[{}]".format(field, k)
+            print("{} {} {}: '{}' has NG words: {}".format(
+                f, _checker.where(djson[e], e), field, t.replace("\r\n", "\\r\\n").replace("\n", "\\n"), ", ".join(ng)))
+            counterr += 1
+
+    if counterr > 0:
+        sys.exit("Issues found")
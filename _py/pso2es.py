@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _stats
+import os
+import sys
+
+# Keep the imports above this line to the bare minimum: every subcommand
+# pulls in what it needs (Pillow, multiprocessing, regex...) only when run.
+# _stats takes its --timing/--profile/--tracemalloc flags out of the
+# arguments and reports on every command on its own.
+
+pydir = os.path.dirname(os.path.realpath(__file__))
+root = os.path.dirname(pydir)
+toolsdir = os.path.join(root, "_tools")
+
+# name: (script, working directory, help)
+# The working directory is "tools" for the _tools scripts that look for
+# their data in ../json, everything else runs from the repository root.
+commands = {
+    "checkjson": ("_py/checkjson.py", "root", "Check that every JSON file loads"),
+    "coverage": ("_py/coverage.py", "root", "Report translation progress per file"),
+    "tidy": ("_py/tidy-json.py", "root", "Reformat the JSON files"),
+    "normalize": ("_tools/normalize.py", "root", "Unicode normalize the translations"),
+    "dupcheck": ("_py/dupcheck.py", "root", "Check for conflicting item mappings"),
+    "dupassign": ("_py/dupassign.py", "root", "Check for duplicate assign entries"),
+    "blocklen": ("_py/BlockLen.py", "root", "Check block name lengths"),
+    "itemlen": ("_py/ItemLen.py", "root", "Check item name lengths"),
+    "titlelen": ("_py/TitleLen.py", "root", "Check title name lengths"),
+    "dicelen": ("_py/DiceLen.py", "root", "Check dice chat line counts"),
+    "itemdesclen": ("_py/ItemDescLen.py", "root", "Check item description line counts"),
+    "limits": ("_py/Limits.py", "root", "Check every size limit in one pass"),
+    "itemfont": ("_py/ItemFont.py", "root", "Check item name widths"),
+    "itemdescfont": ("_py/ItemDescFont.py", "root", "Check and wrap item description widths"),
+    "chipfont": ("_py/ChipFont.py", "root", "Check chip name widths"),
+    "chipdesclong": ("_py/ChipDescLong.py", "root", "Check and wrap long chip description widths"),
+    "chipdescshort": ("_py/ChipDescShort.py", "root", "Check short chip description widths"),
+    "dicefont": ("_py/DiceFont.py", "root", "Check dice chat widths"),
+    "storyfont": ("_py/StoryFont.py", "root", "Check story text widths"),
+    "storybtnfont": ("_py/StoryBTNFont.py", "root", "Check story button widths"),
+    "serve": ("_py/serve.py", "root", "Answer width checks over HTTP on localhost"),
+    "watch": ("_py/watch.py", "root", "Check every JSON file again when it is saved"),
+    "staged": ("_py/staged.py", "root", "Check the JSON files staged for commit"),
+    "termcheck": ("_py/termcheck.py", "root", "Check that the translations follow the glossary"),
+    "ngword": ("_py/ngword.py", "root", "Look for the game's NG words in the translations"),
+    "leftover": ("_py/leftover.py", "root", "Look for Japanese left in the translations"),
+    "tagcheck": ("_py/tagcheck.py", "root", "Check that the translations keep the markup of the JP text"),
+    "search": ("_py/search.py", "root", "Search the texts of every JSON file"),
+    "export-db": ("_py/exportdb.py", "root", "Mirror the JSON files into a SQLite database"),
+    "cluster": ("_py/cluster.py", "root", "Group the JP texts that are nearly the same"),
+    "import": ("_tools/ItemImport.py", "root", "Import item names from a CSV file"),
+    "reset": ("_tools/reset.py", "root", "Reset the non translation fields"),
+    "undo": ("_py/undo.py", "root", "Put back the files the last run changed"),
+    "translate-tickets": ("_tools/TicketDescriptions.py", "tools", "Translate ticket item descriptions"),
+    "translate-dupes": ("_tools/TranslateDupes.py", "tools", "Copy translations between duplicate items"),
+    "item-sets": ("_tools/ItemSets.py", "tools", "Translate item set descriptions"),
+    "item-set-contents": ("_tools/ImportItemSetContents.py", "tools", "Translate item names inside item sets"),
+    "dialogue-names": ("_tools/DialogueNames.py", "tools", "Translate story character names"),
+    "gaiden-effects": ("_tools/GaidenEffects.py", "tools", "Translate gaiden effects"),
+    "link-skills": ("_tools/LinkSkills.py", "tools", "Translate link skills"),
+    "plug-tokens": ("_tools/PlugTokens.py", "tools", "Translate plug tokens"),
+    "seraphy-notes": ("_tools/SeraphyNotes.py", "tools", "Translate Seraphy's notes"),
+}
+
+# Groups run several commands in a row, like the CI jobs do
+groups = {
+    "lint": (
+        ["checkjson", "dupcheck", "dupassign", "itemdesclen", "dicelen",
+         "itemlen", "blocklen", "titlelen"],
+        "Run every check that does not need the fonts"),
+    "font": (
+        ["storybtnfont", "storyfont", "chipfont", "chipdescshort", "dicefont",
+         "itemfont"],
+        "Run every font width check"),
+    "wrap": (
+        ["chipdesclong", "itemdescfont"],
+        "Word wrap the long chip and item descriptions"),
+}
+
+# The checks that only read the json folder and exit, bench-startup runs
+# them. Not serve or watch, which keep running, nor the commands that
+# write files.
+checks = [
+    "checkjson", "coverage", "dupcheck", "dupassign", "blocklen", "itemlen",
+    "titlelen", "dicelen", "itemdesclen", "limits", "itemfont", "chipfont",
+    "chipdescshort", "dicefont", "storyfont", "storybtnfont", "termcheck",
+    "ngword", "leftover", "tagcheck",
+]
+
+
+def usage():
+    print("usage: {} <command> [args...]".format(os.path.basename(sys.argv[0])))
+    print("")
+    print("commands:")
+    for name, (script, cwd, desc) in commands.items():
+        print("  {:<20}{}".format(name, desc))
+    print("")
+    print("groups:")
+    for name, (names, desc) in groups.items():
+        print("  {:<20}{}".format(name, desc))
+    print("")
+    print("  {:<20}{}".format("bench-startup", "Time how long each check takes to start"))
+
+
+def run(name, args):
+    import runpy
+
+    script, cwd, desc = commands[name]
+    path = os.path.join(root, script)
+    oldcwd = os.getcwd()
+    oldargv = sys.argv
+    oldpath = list(sys.path)
+    # The scripts expect to be run directly: argv[0] is the script and its
+    # directory is first on the import path, so `import _fonts` works.
+    sys.argv = [path] + args
+    sys.path.insert(0, os.path.dirname(path))
+    if cwd == "tools":
+        os.chdir(toolsdir)
+    _stats.reset(os.path.basename(script))
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None or e.code == 0:
+            return 0
+        if not isinstance(e.code, int):
+            print(e.code, file=sys.stderr)
+            return 1
+        return e.code
+    finally:
+        _stats.finish()
+        os.chdir(oldcwd)
+        sys.argv = oldargv
+        sys.path[:] = oldpath
+    return 0
+
+
+def rungroup(name, args):
+    names, desc = groups[name]
+    failed = list()
+    for n in names:
+        print("== {}".format(n))
+        sys.stdout.flush()
+        if run(n, args) != 0:
+            failed.append(n)
+    if failed:
+        sys.exit("Issues found in: {}".format(", ".join(failed)))
+    return 0
+
+
+def bench_startup(args):
+    import subprocess
+    import tempfile
+    import time
+
+    # Run every check against an empty json directory so what gets timed is
+    # the interpreter start, the imports and the font setup, not the corpus.
+    rounds = 5
+    if args:
+        rounds = int(args[0])
+    names = checks
+
+    def best(cmd):
+        b = None
+        for i in range(rounds):
+            s = time.perf_counter()
+            subprocess.call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            e = time.perf_counter() - s
+            if b is None or e < b:
+                b = e
+        return b * 1000
+
+    with tempfile.TemporaryDirectory() as empty:
+        base = best([sys.executable, "-c", "pass"])
+        print("{:<20}{:>8.1f} ms".format("(python)", base))
+        print("{:<20}{:>8.1f} ms".format("(pso2es)", best([sys.executable, __file__])))
+        for n in names:
+            t = best([sys.executable, __file__, n, empty])
+            print("{:<20}{:>8.1f} ms".format(n, t))
+    return 0
+
+
+def main(argv):
+    if len(argv) < 1 or argv[0] in ("-h", "--help", "help"):
+        usage()
+        return 0
+    name = argv[0]
+    args = argv[1:]
+    if name == "bench-startup":
+        return bench_startup(args)
+    if name in groups:
+        return rungroup(name, args)
+    if name in commands:
+        return run(name, args)
+    print("Unknown command '{}'".format(name), file=sys.stderr)
+    usage()
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
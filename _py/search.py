@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _checker
+import _jsonio
+import _manifest
+import _stats
+import argparse
+from array import array
+import fnmatch
+import hashlib
+import os
+import pickle
+import re
+import sys
+import unicodedata
+
+# Find a word or a phrase in the jp_ and tr_ texts of every JSON file.
+#
+#   ./_py/search.py [--dir json] [--field tr_text] [--files 'Item_*']
+#                   [--status translated|untranslated] [--limit 50] <text>
+#
+# Uses an index of every text, kept in the .search-index folder next to the
+# json folder. The files that changed since the last search are indexed
+# again, found by their size and time first and their hash then.
+# English is indexed by words, Japanese by every pair of characters, so a
+# search for "photon" does not find "photons" but one for "フォト" finds
+# "フォトン". The hits are then checked against the whole text, so a
+# phrase only matches when it is there as it is, case and width aside.
+
+# Change when what is kept in the index changes, the old one is dropped
+version = 1
+
+words = re.compile(r"[^\W_]+(?:'[^\W_]+)*")
+markup = re.compile(r"<[^>]*>")
+
+
+def fold(text):
+    """The form of a text that is indexed and searched."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def cjk(c):
+    o = ord(c)
+    return (
+        0x3040 <= o <= 0x30FF  # Kana
+        or 0x3400 <= o <= 0x9FFF  # Kanji
+        or 0xF900 <= o <= 0xFAFF
+        or 0xFF66 <= o <= 0xFF9F  # Half width kana
+    )
+
+
+def tokens(text):
+    """Return the words and the character pairs of a folded text."""
+    found = set()
+    for word in words.findall(markup.sub(" ", text)):
+        run = ""
+        for c in word + " ":
+            if c != " " and cjk(c):
+                run += c
+                continue
+            # A single character is not indexed, searching for one reads
+            # every text
+            for n in range(len(run) - 1):
+                found.add(run[n:n + 2])
+            run = ""
+        rest = "".join(" " if cjk(c) else c for c in word).split()
+        found.update(rest)
+    return found
+
+
+def translated(entry, field, item):
+    """Is the tr_ side of this text translated?"""
+    base = field[3:]
+    t = entry.get("tr_" + base)
+    j = entry.get("jp_" + base)
+    if item >= 0:
+        t = t[item] if isinstance(t, list) and item < len(t) else None
+        j = j[item] if isinstance(j, list) and item < len(j) else None
+    if t is None or t == "":
+        return False
+    return j is None or (t != j and t != j.replace("\r\n", "\n"))
+
+
+def documents(djson):
+    """Yield (entry, where, field, item, text, translated) for every text."""
+    for e, entry in enumerate(djson):
+        at = None
+        for field, value in entry.items():
+            if not field.startswith(("jp_", "tr_")):
+                continue
+            values = enumerate(value) if isinstance(value, list) else [(-1, value)]
+            for k, t in values:
+                if not isinstance(t, str) or t == "":
+                    continue
+                if at is None:
+                    at = _checker.where(entry, e)
+                yield e, at, field, k, t, translated(entry, field, k)
+
+
+def build(filename, raw):
+    """Index one file, raw is its content."""
+    with _stats.phase("parse"):
+        djson = _jsonio.loads(raw)
+    docs = list(documents(djson))
+    terms = dict()
+    for n, doc in enumerate(docs):
+        for token in tokens(fold(doc[4])):
+            terms.setdefault(token, array("I")).append(n)
+    _stats.count("indexed")
+    return {
+        "docs": docs,
+        # The postings as bytes, they load much faster than arrays
+        "terms": dict((token, ids.tobytes()) for token, ids in terms.items()),
+    }
+
+
+def path(dir):
+    return os.path.join(os.path.dirname(os.path.abspath(dir)), ".search-index")
+
+
+def read(filename):
+    try:
+        with open(filename, "rb") as f:
+            with _stats.phase("load"):
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def write(filename, data):
+    tmp = filename + ".tmp"
+    with _stats.phase("write"):
+        with open(tmp, "wb") as f:
+            pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, filename)
+
+
+def update(dir, folder=None):
+    """Index the files of dir that changed, return (folder, stamps).
+
+    Every file gets its own index in the folder, stamps has the size, time
+    and hash of every file indexed.
+    """
+    if folder is None:
+        folder = path(dir)
+    os.makedirs(folder, exist_ok=True)
+    manifest = os.path.join(folder, "files")
+    stamps = read(manifest)
+    if stamps is None or stamps.get("version") != version:
+        stamps = {"version": version, "files": dict()}
+    files = stamps["files"]
+    changed = False
+    names = _manifest.files(dir, "json")
+    for name in names:
+        f = os.path.basename(name)
+        st = os.stat(name)
+        stamp = (st.st_size, st.st_mtime_ns)
+        old = files.get(f)
+        if old is not None and old[0] == stamp:
+            continue
+        with open(name, "rb") as j:
+            raw = j.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        if old is None or old[1] != digest:
+            try:
+                write(os.path.join(folder, f), build(name, raw))
+            except ValueError as e:
+                print("{}: {}".format(name, e), file=sys.stderr)
+                continue
+        files[f] = (stamp, digest)
+        changed = True
+    gone = set(files) - set(os.path.basename(name) for name in names)
+    for f in gone:
+        del files[f]
+        os.remove(os.path.join(folder, f))
+    if changed or gone:
+        write(manifest, stamps)
+    return folder, stamps
+
+
+def search(folder, stamps, query, field=None, files=None, status=None):
+    """Yield (file, where, field, text) for the texts with the query in them.
+
+    field is a field name, with or without its jp_/tr_, files a glob of
+    the file names and status "translated" or "untranslated". Only the
+    index of the files that can match is read.
+    """
+    q = fold(query)
+    wanted = tokens(q)
+    for f in sorted(stamps["files"]):
+        if files is not None and not fnmatch.fnmatch(f, files) and not fnmatch.fnmatch(os.path.splitext(f)[0], files):
+            continue
+        part = read(os.path.join(folder, f))
+        if part is None:
+            continue
+        terms = part["terms"]
+        if wanted:
+            hits = None
+            # The rarest first
+            for token in sorted(wanted, key=lambda t: len(terms.get(t, b""))):
+                ids = terms.get(token)
+                if ids is None:
+                    hits = set()
+                    break
+                ids = array("I", ids)
+                hits = set(ids) if hits is None else hits.intersection(ids)
+                if not hits:
+                    break
+            hits = sorted(hits)
+        else:
+            hits = range(len(part["docs"]))
+        for n in hits:
+            e, at, name, k, text, done = part["docs"][n]
+            if field is not None and field not in (name, name[3:]):
+                continue
+            if status is not None and done != (status == "translated"):
+                continue
+            if q not in fold(text):
+                continue
+            if k >= 0:
+                name = "{}[{}]".format(name, k)
+            yield os.path.splitext(f)[0], at, name, text
+
+
+def snippet(text, query, width=30):
+    """The part of the text around the query, on one line."""
+    t = text.replace("\r\n", "\\n").replace("\n", "\\n")
+    n = fold(t).find(fold(query))
+    if n < 0 or len(fold(t)) != len(t):
+        n = 0
+    start = max(n - width, 0)
+    s = t[start:n + len(query) + width]
+    if start > 0:
+        s = "..." + s
+    if n + len(query) + width < len(t):
+        s = s + "..."
+    return s
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Search the texts of every JSON file")
+    parser.add_argument("query", nargs="+")
+    parser.add_argument("--dir", default="json")
+    parser.add_argument("--field", help="only this field, like tr_text or explain")
+    parser.add_argument("--files", help="only the files matching this glob, like 'Item_*'")
+    parser.add_argument("--status", choices=("translated", "untranslated"))
+    parser.add_argument("--limit", type=int, default=50, help="at most this many hits, 0 for all")
+    parser.add_argument("--index", help="the folder to keep the index in")
+    args = parser.parse_args()
+
+    query = " ".join(args.query)
+    folder, stamps = update(args.dir, args.index)
+    with _stats.phase("search"):
+        found = 0
+        for f, at, name, text in search(folder, stamps, query, args.field, args.files, args.status):
+            found += 1
+            if args.limit and found > args.limit:
+                continue
+            print("{} {} {}: {}".format(f, at, name, snippet(text, query)))
+    if args.limit and found > args.limit:
+        print("... {} more".format(found - args.limit))
+    if not found:
+        sys.exit(1)
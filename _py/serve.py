@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _checker
+import _fonts
+import _limits
+import _manifest
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
+import os
+import platform
+import sys
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+# Keeps the fonts and the parsed JSON files loaded, so editors and hooks can
+# ask for widths without starting Python and loading Pillow every time.
+#
+#   ./_py/serve.py [jsondir] [port] [scale]
+#
+# GET or POST (form or JSON body), every answer is JSON:
+#   /measure?rule=ItemFont&text=...   the text measured by every rule of that name
+#   /measure?file=X.txt&field=tr_text&text=...
+#                                     or by the rules covering that file and field,
+#                                     &jp=... gives a dialogue box the lines of the JP text
+#   /wrap?rule=ItemDescFont&text=...  the text word wrapped at the rule's limit
+#   /check?file=Item_Stack_PaidTicket.txt
+#                                     what the checkers would report for a file
+#
+# The files are parsed again when they change on disk, files added to or
+# removed from the json folder are picked up on the next request.
+
+dir = "json"
+corpus = dict()
+reports = dict()
+state = dict()
+
+
+def index():
+    """Set up the rules again if files were added or removed."""
+    stamp = os.stat(dir).st_mtime_ns
+    if state.get("stamp") != stamp or groups_changed():
+        state["stamp"] = stamp
+        state["filenames"] = _checker.setup(dir)
+        state["groups"] = groups_stamp()
+        reports.clear()
+
+
+def groups_stamp():
+    # The only/unless groups hold texts of other files, ChipFont needs the
+    # translated weapon names
+    stamps = dict()
+    for rule in _checker.rules:
+        for g in (rule.get("only"), rule.get("unless")):
+            if g is not None:
+                for filename in _manifest.files(dir, g):
+                    stamps[filename] = os.stat(filename).st_mtime_ns
+    return stamps
+
+
+def groups_changed():
+    for filename, stamp in state.get("groups", dict()).items():
+        try:
+            if os.stat(filename).st_mtime_ns != stamp:
+                return True
+        except OSError:
+            return True
+    return False
+
+
+def load(filename):
+    """Return the parsed file, parsing it again only when it changed."""
+    st = os.stat(filename)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = corpus.get(filename)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _checker.load(filename))
+        corpus[filename] = cached
+        reports.pop(filename, None)
+    return cached[1]
+
+
+def path(name):
+    """Find a file of the json folder by path or by name."""
+    if name in _checker.which:
+        return name
+    base = os.path.basename(name)
+    if not base.endswith(".txt"):
+        base += ".txt"
+    for filename in state["filenames"]:
+        if os.path.basename(filename) == base:
+            return filename
+    raise ValueError("Unknown file '{}'".format(name))
+
+
+def pick(q):
+    if "rule" in q:
+        found = [r for r in _checker.rules if r["name"] == q["rule"]]
+    elif "file" in q:
+        groups = _manifest.classify(q["file"])
+        found = [r for r in _checker.rules if r["files"] in groups and r["field"] == q.get("field", r["field"])]
+    else:
+        raise ValueError("Need a rule or a file")
+    if not found:
+        raise ValueError("No rule for that")
+    # Rules that only cover other files measure the same
+    unique = OrderedDict()
+    for rule in found:
+        unique.setdefault((rule["name"], rule["field"], rule["limit"]), rule)
+    return list(unique.values())
+
+
+def describe(rule, text, value, toomany=False):
+    """toomany is True when the text has more lines than the rule allows."""
+    n = len(_checker.lines(text))
+    if value > rule["limit"]:
+        message = _checker.message(rule, text, value)
+    elif toomany:
+        message = _checker.message(rule, text, n, True)
+    else:
+        message = None
+    return {
+        "rule": rule["name"],
+        "label": rule["label"],
+        "measure": rule["measure"],
+        "text": text,
+        "value": value,
+        "limit": rule["limit"],
+        "lines": n,
+        "fits": message is None,
+        "message": message,
+    }
+
+
+def toomany(rule, text, jp=None):
+    room = _checker.room(rule, jp)
+    return bool(room) and len(_checker.lines(text)) > room
+
+
+def measure(q):
+    text = q["text"]
+    return [
+        describe(rule, text, _checker.measure(rule, text), toomany(rule, text, q.get("jp")))
+        for rule in pick(q)
+    ]
+
+
+def wrap(q):
+    rule = pick(q)[0]
+    if rule["measure"] != "font":
+        raise ValueError("Rule '{}' does not measure widths".format(rule["name"]))
+    ww = _checker.word_wrap(q["text"], rule["limit"])
+    return describe(rule, ww, _checker.measure(rule, ww), toomany(rule, ww, q.get("jp")))
+
+
+def check(q):
+    filename = path(q["file"])
+    djson = load(filename)
+    # Measured again only when the file or the rules changed
+    if filename in reports:
+        return reports[filename]
+    report = [
+        # The line count comes back as the value of the texts over their room
+        describe(rule, text, _checker.measure(rule, text) if toomany else value, toomany)
+        for rule, text, value, toomany in _checker.findings(filename, djson)
+    ]
+    reports[filename] = report
+    return report
+
+
+def parse(body, form):
+    """The query in a POST body, a form or a JSON object of strings."""
+    if body is None:
+        return dict()
+    body = body.decode("utf-8")
+    if form:
+        return dict(parse_qsl(body))
+    q = json.loads(body)
+    if not isinstance(q, dict):
+        raise ValueError("The body is not a JSON object")
+    for key, value in q.items():
+        if not isinstance(value, str):
+            raise ValueError("'{}' is not a string".format(key))
+    return q
+
+
+handlers = {
+    "/measure": measure,
+    "/wrap": wrap,
+    "/check": check,
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    def answer(self, code, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def handle_query(self, body=None, form=True):
+        url = urlsplit(self.path)
+        if url.path not in handlers:
+            return self.answer(404, {"error": "Unknown request '{}'".format(url.path)})
+        s = time.perf_counter()
+        try:
+            q = parse(body, form)
+            q.update(parse_qsl(url.query))
+            index()
+            result = handlers[url.path](q)
+        except KeyError as e:
+            return self.answer(400, {"error": "Missing {}".format(e)})
+        except (ValueError, OSError) as e:
+            return self.answer(400, {"error": str(e)})
+        self.answer(200, {"result": result, "ms": (time.perf_counter() - s) * 1000})
+
+    def do_GET(self):
+        self.handle_query()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.handle_query(body, not self.headers.get("Content-Type", "").startswith("application/json"))
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == '__main__':
+    # Need the json path
+    if len(sys.argv) >= 2:
+        dir = sys.argv[1]
+
+    port = 8765
+    if len(sys.argv) >= 3:
+        port = int(sys.argv[2])
+
+    if len(sys.argv) == 4 and sys.argv[3] != "0":
+        _fonts.init(int(sys.argv[3]))
+    elif platform.system() == 'Windows':
+        _fonts.init(1)
+    else:
+        _fonts.init()
+
+    index()
+    for filename in state["filenames"]:
+        load(filename)
+
+    # Only listen on this machine
+    server = HTTPServer(("127.0.0.1", port), Handler)
+    print("Serving {} rules over {} files on http://127.0.0.1:{}/".format(
+        len(_limits.rules), len(state["filenames"]), port))
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _checker
+import _fonts
+import _jsonio
+import _limits
+import _manifest
+from collections import OrderedDict
+import dupassign
+import os
+import platform
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_tools"))
+import normalize  # noqa: E402
+
+# Check only the JSON files staged for the next commit, as they are in the
+# index and not as they are in the working tree. Use it as the pre-commit
+# hook:
+#
+#   ln -s ../../_sh/pre-commit .git/hooks/pre-commit
+#
+# Runs checkjson, tidy-json, normalize, dupassign and the size limits of
+# _limits.py over those files. The checks that need other files, like the
+# weaponoid chip names, read them from the working tree.
+
+dir = "json"
+
+
+def git(*args, **kwargs):
+    return subprocess.run(("git",) + args, stdout=subprocess.PIPE, check=True, **kwargs).stdout
+
+
+def staged():
+    """Return the paths of the staged JSON files, added or modified."""
+    out = git("diff", "--cached", "--name-only", "--diff-filter=ACMR", "-z", "--", dir)
+    names = [os.fsdecode(n) for n in out.split(b"\0") if n]
+    return [n for n in names if n.endswith(".txt") and "json" in _manifest.classify(n)]
+
+
+def blobs(names):
+    """Return the staged content of the files, read in one go."""
+    out = git("cat-file", "--batch", input="".join(":{}\n".format(n) for n in names).encode("utf-8"))
+    content = OrderedDict()
+    n = 0
+    for name in names:
+        end = out.index(b"\n", n)
+        sha, kind, size = out[n:end].split(b" ")
+        n = end + 1
+        content[name] = out[n:n + int(size)].decode("utf-8")
+        n += int(size) + 1
+    return content
+
+
+def tidy(sfile, sjson):
+    return sfile == _jsonio.dumps(sjson) + "\n"
+
+
+def overlay(parsed):
+    """Use the staged texts in the only/unless groups too."""
+    for (g, field) in list(_checker.groups):
+        if not any(g in _manifest.classify(name) for name in parsed):
+            continue
+        rule = {"field": field}
+        group = set()
+        for filename in set(_manifest.files(dir, g)) | set(parsed):
+            if filename in parsed:
+                if g in _manifest.classify(filename):
+                    group.update(t for e, k, t in _checker.texts(rule, parsed[filename]))
+            else:
+                group.update(t for e, k, t in _checker.texts(rule, _checker.load(filename)))
+        _checker.groups[(g, field)] = group
+
+
+if __name__ == '__main__':
+    # error counter
+    counterr = 0
+
+    os.chdir(git("rev-parse", "--show-toplevel").decode("utf-8").strip())
+    names = staged()
+    if not names:
+        sys.exit(0)
+
+    parsed = OrderedDict()
+    for name, sfile in blobs(names).items():
+        try:
+            sjson = _jsonio.loads(sfile)
+        except ValueError as e:
+            print("{}: {}".format(name, e))
+            counterr += 1
+            continue
+        if len(sjson) == 0:
+            print("{}: {}".format(name, "BLANK"))
+            counterr += 1
+            continue
+        parsed[name] = sjson
+        if not tidy(sfile, sjson):
+            print("Tidy up {}".format(name))
+            counterr += 1
+        nk = 'NFKC'
+        if "nfc" in _manifest.classify(name):
+            nk = 'NFC'
+        # normalize works in place, give it a copy
+        if normalize.normalize(name, _jsonio.loads(sfile), nk):
+            print("Normalize {}".format(name))
+            counterr += 1
+        for line in dupassign.check(name, sjson):
+            print(line)
+            counterr += 1
+
+    # Only the rules covering the staged files, the fonts are only loaded
+    # when one of them measures widths
+    covered = set(g for name in parsed for g in _manifest.classify(name))
+    picked = [r["name"] for r in _limits.rules if r["files"] in covered]
+    if picked:
+        _checker.setup(dir, picked)
+        overlay(parsed)
+        if any(r["measure"] == "font" for r in _checker.rules):
+            if platform.system() == 'Windows':
+                _fonts.init(1)
+            else:
+                _fonts.init()
+        for name, sjson in parsed.items():
+            groups = _manifest.classify(name)
+            _checker.which[name] = [i for i, r in enumerate(_checker.rules) if r["files"] in groups]
+            for rule, text, value, toomany in _checker.findings(name, sjson):
+                print("{}: {}".format(name, _checker.message(rule, text, value, toomany)))
+                if _checker.fails(rule, value, toomany):
+                    counterr += 1
+
+    if counterr > 0:
+        sys.exit("Issues found")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _checker
+import _manifest
+import _markup
+import multiprocessing as mp
+import os
+import sys
+
+# Check that the translations keep the placeholders and the markup of the
+# JP text: <%CHARANAME>, <color=...>...</color>, <yellow>...<c> and the
+# rest (see _markup.py), and that their tags are closed in order.
+#
+#   ./_py/tagcheck.py [jsondir]
+#
+# A missing </color> or <%abi> shows up as is in the game, or breaks the
+# rest of the text.
+
+
+def scan(djson, start=0):
+    """Return (entry, field, item, problems) for the translations with markup problems."""
+    found = list()
+    for n, entry in enumerate(djson, start):
+        for field in entry:
+            if not field.startswith("tr_"):
+                continue
+            jfield = "jp_" + field[3:]
+            for e, k, t in _checker.texts({"field": field}, [entry], n):
+                j = entry.get(jfield)
+                if k >= 0:
+                    j = j[k] if isinstance(j, list) and k < len(j) else None
+                if not isinstance(j, str):
+                    continue
+                problems = _markup.compare(j, t)
+                if problems:
+                    found.append((e, field, k, problems))
+    return found
+
+
+def check(job):
+    filename, part, parts = job
+    djson = _checker.load(filename)
+    start, stop = _checker.bounds(len(djson), part, parts)
+    return scan(djson[start:stop], start)
+
+
+if __name__ == '__main__':
+    mp.freeze_support()
+    # error counter
+    counterr = 0
+
+    # Need the json path
+    if len(sys.argv) < 2:
+        dir = "json"
+    else:
+        dir = sys.argv[1]
+
+    filenames = _manifest.files(dir, "json")
+    jobs = _checker.plan(filenames, os.cpu_count() or 1)
+    results = dict((filename, list()) for filename in filenames)
+    for job, result in zip(jobs, _checker.schedule(check, jobs)):
+        results[job[0]].extend(result)
+
+    for filename in filenames:
+        if not results[filename]:
+            continue
+        f = os.path.splitext(os.path.basename(filename))[0]
+        djson = _checker.load(filename)
+        for e, field, k, problems in sorted(results[filename]):
+            t = _checker.text({"field": field}, djson[e], k)
+            if k >= 0:
+                field = "{}[{}]".format(field, k)
+            print("{} {} {}: '{}' {}".format(
+                f, _checker.where(djson[e], e), field, t.replace("\r\n", "\\r\\n").replace("\n", "\\n"), ", ".join(problems)))
+            counterr += 1
+
+    if counterr > 0:
+        sys.exit("Issues found")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _checker
+import _glossary
+import _manifest
+from collections import OrderedDict
+import multiprocessing as mp
+import os
+import sys
+import unicodedata
+
+# Check that the translations use the terms of glossary.json: every
+# translated text whose JP side has a JP term needs its translation (or
+# one of the "also" ones) on the TR side, case aside.
+#
+#   ./_py/termcheck.py [jsondir]
+#
+# The JP terms are all looked for in one pass over each text, the longest
+# one wins where they overlap. The report is grouped by term.
+
+glossary = _glossary.load()
+terms = _glossary.matcher(glossary)
+
+
+def fold(text):
+    # A term can be wrapped over two lines
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def scan(djson, start=0):
+    """Return (term index, entry, field, item) for the texts missing a term."""
+    found = list()
+    index = dict((id(term), n) for n, term in enumerate(glossary))
+    for n, entry in enumerate(djson, start):
+        for field in entry:
+            if not field.startswith("tr_"):
+                continue
+            jfield = "jp_" + field[3:]
+            for e, k, t in _checker.texts({"field": field}, [entry], n):
+                j = entry.get(jfield)
+                if k >= 0:
+                    j = j[k] if isinstance(j, list) and k < len(j) else None
+                if not j:
+                    continue
+                ft = fold(t)
+                for s, end, term in _glossary.longest(terms.find(j)):
+                    wanted = [term["en"]] + term.get("also", [])
+                    if term["jp"] in t:
+                        # Left untranslated, leftover.py reports it
+                        continue
+                    if not any(fold(w) in ft for w in wanted):
+                        found.append((index[id(term)], e, field, k))
+    return found
+
+
+def check(job):
+    filename, part, parts = job
+    djson = _checker.load(filename)
+    start, stop = _checker.bounds(len(djson), part, parts)
+    return scan(djson[start:stop], start)
+
+
+if __name__ == '__main__':
+    mp.freeze_support()
+    # error counter
+    counterr = 0
+
+    # Need the json path
+    if len(sys.argv) < 2:
+        dir = "json"
+    else:
+        dir = sys.argv[1]
+
+    filenames = _manifest.files(dir, "json")
+    jobs = _checker.plan(filenames, os.cpu_count() or 1)
+    results = dict((filename, list()) for filename in filenames)
+    for job, result in zip(jobs, _checker.schedule(check, jobs)):
+        results[job[0]].extend(result)
+
+    # By term, then in file order
+    byterm = OrderedDict((n, list()) for n in range(len(glossary)))
+    for filename in filenames:
+        if not results[filename]:
+            continue
+        f = os.path.splitext(os.path.basename(filename))[0]
+        djson = _checker.load(filename)
+        for n, e, field, k in sorted(results[filename], key=lambda r: r[1:]):
+            t = _checker.text({"field": field}, djson[e], k)
+            if k >= 0:
+                field = "{}[{}]".format(field, k)
+            byterm[n].append("{} {} {}: '{}'".format(
+                f, _checker.where(djson[e], e), field, t.replace("\r\n", "\\r\\n").replace("\n", "\\n")))
+
+    for n, lines in byterm.items():
+        if not lines:
+            continue
+        print("{} -> {}: {} texts without it".format(glossary[n]["jp"], glossary[n]["en"], len(lines)))
+        for line in lines:
+            print("  " + line)
+        counterr += len(lines)
+
+    if counterr > 0:
+        sys.exit("Issues found")
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import leftover
+import unittest
+
+# What leftover.py flags and what it leaves alone.
+#
+#   python3 -m unittest discover -s _py -p 'test_*.py'
+
+
+class Dirty(unittest.TestCase):
+    def test_allowed(self):
+        for c in leftover.allowed:
+            self.assertFalse(leftover.dirty("Shop {}1 Special".format(c)), c)
+
+    def test_punctuation(self):
+        for t in ["Yes　no", "「Quote」", "One、two。", "（Note）", "ＡＢＣ！"]:
+            self.assertFalse(leftover.dirty(t), t)
+
+    def test_japanese(self):
+        for t in ["Rappy の羽", "カタカナ", "ｶﾀｶﾅ", "Kanji 部", "人々"]:
+            self.assertTrue(leftover.dirty(t), t)
+
+    def test_left(self):
+        self.assertEqual(leftover.left("★ Rappy の羽の ※"), "の羽")
+
+
+if __name__ == '__main__':
+    unittest.main()
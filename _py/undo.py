@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _writeback
+import os
+import sys
+
+# Put back the files the last run of a tool changed, from the journal of
+# _writeback.py.
+#
+#   ./_py/undo.py [jsondir] [--list] [--force]
+#
+# --list shows the runs that can be undone, the last one last. A file that
+# changed again since is left alone and nothing is undone, unless --force.
+
+if __name__ == '__main__':
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    # Need the json path
+    if len(args) < 1:
+        dir = "json"
+    else:
+        dir = args[0]
+
+    path = _writeback.folder(os.path.join(dir, "x"))
+    root = os.path.dirname(path)
+    entries = _writeback.runs(path)
+    if not entries:
+        sys.exit("Nothing to undo")
+
+    if "--list" in sys.argv:
+        for entry in entries:
+            print("{} {}: {} files".format(entry["time"], " ".join(entry["argv"]), len(entry["files"])))
+            for name, before, after in entry["files"]:
+                print("  {}{}".format(name, "" if before is not None else " (new)"))
+        sys.exit(0)
+
+    entry = entries[-1]
+    changed = list()
+    for name, before, after in entry["files"]:
+        data = _writeback.read(os.path.join(root, name))
+        if data is None or _writeback.blob(data) != after:
+            changed.append(name)
+    if changed and "--force" not in sys.argv:
+        for name in changed:
+            print("{} changed since {}".format(name, entry["time"]))
+        sys.exit("Not undoing, --force to anyway")
+
+    removed = list()
+    for name, before, after in entry["files"]:
+        filename = os.path.join(root, name)
+        if before is None:
+            removed.append(filename)
+            continue
+        with open(os.path.join(path, "objects", before), mode='rb') as f:
+            _writeback.put(filename, f.read())
+    _writeback.commit(journal=False)
+    for filename in removed:
+        if os.path.exists(filename):
+            os.remove(filename)
+    _writeback.save(path, entries[:-1])
+    print("Undid {} ({}): {} files".format(" ".join(entry["argv"]), entry["time"], len(entry["files"])))
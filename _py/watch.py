@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import _checker
+import _fonts
+import _manifest
+import os
+import platform
+import select
+import struct
+import sys
+import time
+
+# Re-run the size checks of a file every time it is saved.
+#
+#   ./_py/watch.py [jsondir] [scale]
+#
+# Only the rules covering the saved file are run, over that file only.
+# Uses inotify on Linux and looks at the file times twice a second anywhere
+# else.
+
+# Editors write a file in several steps, wait for this long without any
+# event before checking
+debounce = 0.05
+poll = 0.5
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_CLOEXEC = 0o2000000
+
+
+class Inotify(object):
+    def __init__(self, dir):
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        mask = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(self.fd, os.fsencode(dir), mask) < 0:
+            raise OSError(ctypes.get_errno(), "inotify_add_watch")
+        self.dir = dir
+
+    def read(self):
+        names = set()
+        data = os.read(self.fd, 65536)
+        n = 0
+        while n < len(data):
+            wd, mask, cookie, size = struct.unpack_from("iIII", data, n)
+            n += 16
+            name = data[n:n + size].rstrip(b"\0")
+            n += size
+            if name:
+                names.add(os.path.join(self.dir, os.fsdecode(name)))
+        return names
+
+    def wait(self):
+        """Block until files changed, return their paths."""
+        select.select([self.fd], [], [])
+        names = self.read()
+        while select.select([self.fd], [], [], debounce)[0]:
+            names |= self.read()
+        return names
+
+
+class Poll(object):
+    def __init__(self, dir):
+        self.dir = dir
+        self.stamps = self.scan()
+
+    def scan(self):
+        stamps = dict()
+        for entry in os.scandir(self.dir):
+            st = entry.stat()
+            stamps[entry.path] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def wait(self):
+        while True:
+            time.sleep(poll)
+            stamps = self.scan()
+            names = set(
+                f for f in set(stamps) | set(self.stamps)
+                if stamps.get(f) != self.stamps.get(f))
+            self.stamps = stamps
+            if names:
+                return names
+
+
+def watcher(dir):
+    if platform.system() == 'Linux':
+        try:
+            return Inotify(dir)
+        except (OSError, AttributeError):
+            pass
+    return Poll(dir)
+
+
+def partials(dir):
+    """Split the texts of the only/unless groups by file.
+
+    A save then only reads the saved file again to update them.
+    """
+    parts = dict()
+    for g, field in _checker.groups:
+        rule = {"field": field}
+        parts[(g, field)] = dict(
+            (filename, set(t for e, k, t in _checker.texts(rule, _checker.load(filename))))
+            for filename in _manifest.files(dir, g))
+    return parts
+
+
+def cross(dir, filename, djson, parts):
+    """Update the only/unless groups from a saved file.
+
+    Returns the texts that moved in or out of a group and the rules to
+    check them against.
+    """
+    names = _manifest.classify(filename)
+    changed = set()
+    picked = set()
+    for (g, field), files in parts.items():
+        if g not in names:
+            continue
+        rule = {"field": field}
+        now = set(t for e, k, t in _checker.texts(rule, djson)) if djson is not None else set()
+        before = files.get(filename, set())
+        if djson is None:
+            files.pop(filename, None)
+        else:
+            files[filename] = now
+        group = set()
+        for texts in files.values():
+            group |= texts
+        delta = _checker.groups[(g, field)] ^ group
+        _checker.groups[(g, field)] = group
+        if delta or now != before:
+            changed |= delta
+            picked |= set(
+                i for i, r in enumerate(_checker.rules)
+                if g in (r.get("only"), r.get("unless")) and r["field"] == field)
+    return changed, picked
+
+
+def recheck(dir, changed, picked):
+    """Check the texts that moved in or out of a group again, in every file."""
+    for i in sorted(picked):
+        rule = _checker.rules[i]
+        only = _checker.groups.get((rule.get("only"), rule["field"]))
+        unless = _checker.groups.get((rule.get("unless"), rule["field"]))
+        for filename in _manifest.files(dir, rule["files"]):
+            seen = set()
+            for e, k, t in _checker.texts(rule, _checker.load(filename)):
+                if t not in changed or t in seen:
+                    continue
+                seen.add(t)
+                if only is not None and t not in only:
+                    continue
+                if unless is not None and t in unless:
+                    continue
+                value = _checker.measure(rule, t)
+                if value > rule["limit"]:
+                    print("{}: {}".format(
+                        os.path.basename(filename), _checker.message(rule, t, value)))
+
+
+def covered(filename):
+    """Is the file in a group some rule checks?"""
+    names = set(_manifest.classify(filename))
+    return any(rule["files"] in names for rule in _checker.rules)
+
+
+def changed(dir, filename, parts):
+    s = time.perf_counter()
+    f = os.path.basename(filename)
+    djson = None
+    if os.path.exists(filename):
+        try:
+            djson = _checker.load(filename)
+        except ValueError as e:
+            print("== {}: {}".format(f, e))
+            return
+        except OSError:
+            # Gone again, like the temp file of an editor saving
+            pass
+    if djson is None:
+        print("== {} removed".format(f))
+    else:
+        if filename not in _checker.which and covered(filename):
+            # A new file, see which rules cover it
+            _checker.setup(dir)
+        if filename not in _checker.which:
+            print("== {}: no rule covers it".format(f))
+        else:
+            print("== {}".format(f))
+            found = 0
+            for rule, text, value, toomany in _checker.findings(filename, djson):
+                print(_checker.message(rule, text, value, toomany))
+                found += 1
+            if not found:
+                print("No issues")
+
+    moved, picked = cross(dir, filename, djson, parts)
+    if moved:
+        recheck(dir, moved, picked)
+    if djson is None:
+        _checker.setup(dir)
+    print("({:.0f} ms)".format((time.perf_counter() - s) * 1000))
+    sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    # Need the json path
+    if len(sys.argv) < 2:
+        dir = "json"
+    else:
+        dir = sys.argv[1]
+
+    if len(sys.argv) == 3 and sys.argv[2] != "0":
+        _fonts.init(int(sys.argv[2]))
+    elif platform.system() == 'Windows':
+        _fonts.init(1)
+    else:
+        _fonts.init()
+
+    _checker.setup(dir)
+    parts = partials(dir)
+    w = watcher(dir)
+    print("Watching {} with {}".format(dir, type(w).__name__))
+    sys.stdout.flush()
+    try:
+        while True:
+            for filename in sorted(w.wait()):
+                if filename.endswith(".txt"):
+                    changed(dir, filename, parts)
+    except KeyboardInterrupt:
+        pass
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 # coding=utf8
 import codecs
-import json
 import os
 import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _jsonio  # noqa: E402
+import _stats  # noqa: E402
 
 json_loc = os.path.join("..", "json")
 
@@ -144,7 +148,8 @@ character_names = {
 try:
     chips_file = codecs.open(os.path.join(json_loc, "Name_Chip_SPArksName.txt"),
                              mode = 'r', encoding = 'utf-8')
-    chips = json.load(chips_file)
+    with _stats.phase("parse"):
+        chips = _jsonio.load(chips_file)
     print("Chip names loaded")
     chips_file.close()
     
@@ -161,7 +166,8 @@ for name in file_names:
         print("\t{0} not found.".format(items_file_name))
         continue
     
-    items = json.load(items_file)
+    with _stats.phase("parse"):
+        items = _jsonio.load(items_file)
     print("{0} loaded.".format(items_file_name))
     
     items_file.close()
@@ -184,8 +190,5 @@ for name in file_names:
                     print("Unknown character name in {0}: {1}".format(name, item["jp_name"]))
                     unknowns.append(item["jp_name"])
 
-    items_file = codecs.open(os.path.join(json_loc, items_file_name),
-                             mode = 'w', encoding = 'utf-8')
-    json.dump(items, items_file, ensure_ascii=False, indent="\t", sort_keys=False)
-    items_file.write("\n")
-    items_file.close()
+    with _stats.phase("write"):
+        _jsonio.write(os.path.join(json_loc, items_file_name), items)
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 # coding=utf8
 import codecs
-import json
 import os
 import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _glossary  # noqa: E402
+import _jsonio  # noqa: E402
+import _stats  # noqa: E402
 
 json_loc = os.path.join("..", "json")
 
@@ -17,7 +22,8 @@ try:
                              mode = 'r', encoding = 'utf-8')
 except FileNotFoundError:
     print("\t{0} not found.".format(effect_names_file_name))
-effect_names = json.load(effect_names_file)
+with _stats.phase("parse"):
+    effect_names = _jsonio.load(effect_names_file)
 print("{0} loaded.".format(effect_names_file_name))
 effect_names_file.close()
 
@@ -27,7 +33,8 @@ try:
                              mode = 'r', encoding = 'utf-8')
 except FileNotFoundError:
     print("\t{0} not found.".format(effect_descriptions_file_name))
-effect_descriptions = json.load(effect_descriptions_file)
+with _stats.phase("parse"):
+    effect_descriptions = _jsonio.load(effect_descriptions_file)
 print("{0} loaded.".format(effect_descriptions_file_name))
 effect_descriptions_file.close()
 
@@ -80,6 +87,9 @@ effect_effects = { # dictionary of lambdas because there's no such thing as swit
                                                   " when equipped."),
     }
 
+# The element names are in _py/glossary.json
+elements = _glossary.terms("element")
+
 unknowns = []
 
 for effect in effect_names:
@@ -97,6 +107,9 @@ for effect in effect_names:
                     # some things are used in multiple effect types
                     effect_text = effect_text.replace("ＨＰ", "HP")
                     effect_text = effect_text.replace("法術", "Techs")
+                    for jp, en in elements.items():
+                        effect_text = effect_text.replace(jp, en)
+                    # and the elements on their own
                     effect_text = effect_text.replace("炎", "Fire ")
                     effect_text = effect_text.replace("氷", "Ice ")
                     effect_text = effect_text.replace("雷", "Lightning ")
@@ -113,14 +126,8 @@ for effect in effect_names:
                 unknowns.append(effect["jp_text"])
 
 # write JSON back to files
-effect_names_file = codecs.open(os.path.join(json_loc, effect_names_file_name),
-                          mode = 'w', encoding = 'utf-8')
-json.dump(effect_names, effect_names_file, ensure_ascii=False, indent="\t", sort_keys=False)
-effect_names_file.write("\n")
-effect_names_file.close()
+with _stats.phase("write"):
+    _jsonio.write(os.path.join(json_loc, effect_names_file_name), effect_names)
 
-effect_descriptions_file = codecs.open(os.path.join(json_loc, effect_descriptions_file_name),
-                          mode = 'w', encoding = 'utf-8')
-json.dump(effect_descriptions, effect_descriptions_file, ensure_ascii=False, indent="\t", sort_keys=False)
-effect_descriptions_file.write("\n")
-effect_descriptions_file.close()
+with _stats.phase("write"):
+    _jsonio.write(os.path.join(json_loc, effect_descriptions_file_name), effect_descriptions)
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 # coding=utf8
 import codecs
-import json
 import os
 import regex
-import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _jsonio  # noqa: E402
+import _stats  # noqa: E402
+import _writeback  # noqa: E402
 
 # This is Dabir's PSO2es item set description auto-translator script.
 # This script will not translate:
@@ -20,13 +24,9 @@ import shutil
 json_loc = os.path.join("..", "json")
 
 try:
-    print("Backing up and loading ItemBags file.")
-    itembags_file = codecs.open(
-        shutil.copyfile(os.path.join(json_loc,
-                                     'Item_Stack_ItemBag.txt'),
-                        os.path.join(json_loc,
-                                     'Item_Stack_ItemBag.txt.old')),
-        mode='r', encoding='utf-8')
+    print("Loading ItemBags file.")
+    itembags_file = codecs.open(os.path.join(json_loc, 'Item_Stack_ItemBag.txt'),
+                                mode='r', encoding='utf-8')
 except FileNotFoundError:
     print("No ItemBags file found, quitting.")
     raise SystemExit
@@ -34,13 +34,9 @@ except FileNotFoundError:
 itembags = itembags_file.read()
 itembags_file.close()
 
-print("  ItemBags file loaded and backed up.\n\
-  If an error occurs during this script's execution,\n\
-  replace Item_Stack_ItemBag.txt with Item_Stack_ItemBag.txt.old\n\
-  before taking any other action.")
-
-output_file = codecs.open(os.path.join(json_loc, 'Item_Stack_ItemBag.txt'),
-                          mode='w', encoding='utf-8')
+print("  ItemBags file loaded.\n\
+  It is only saved if the script gets to the end,\n\
+  ../_py/undo.py ../json puts it back afterwards.")
 
 print("Performing pre-translation formatting.")
 # Copy JP text into TR text
@@ -140,7 +136,8 @@ for contents_file_name in contents_files:
         print("\t{0} not found.".format(contents_file_name))
         continue
 
-    contents = json.load(contents_file)
+    with _stats.phase("parse"):
+        contents = _jsonio.load(contents_file)
     print("{0} loaded.".format(contents_file_name))
 
     repcount = 0  # Number of items in ItemBags translated from this file
@@ -176,6 +173,6 @@ itembags = regex.sub('\[(.+) Body GV\] parts',
                      itembags)
 
 print("All contents files checked.\nSaving item sets.")
-output_file.write(itembags)
-output_file.close()
+with _stats.phase("write"):
+    _writeback.put(os.path.join(json_loc, 'Item_Stack_ItemBag.txt'), itembags)
 print("Item sets saved. Exiting script.")
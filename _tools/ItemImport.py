@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import codecs
-from collections import OrderedDict
 import csv
-import fnmatch
-import json
 import os
 import sys
 import unicodedata
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _jsonio  # noqa: E402
+import _manifest  # noqa: E402
+import _stats  # noqa: E402
+
 TR_name = {"": ""}
 JP_dup = dict()
 TR_dup = dict()
@@ -70,48 +72,15 @@ for line in CSV:
         print("item Desc {} is too long".format(k))
     TR_src[k] = "CSV"
 
-json_files = [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'Item_*.txt')
-]
-
-json_files += [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'Explain_Actor_*.txt')
-]
-
-json_files += [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'Explain_SkillRing.txt')
-]
-
-json_files += [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'Explain_System.txt')
-]
-
-json_files += [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'Name_Actor_MagName.txt')
-]
-
-json_files += [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'Name_UICharMake_*.txt')
-]
+json_files = _manifest.files(dir, "item_import")
 
 for files in json_files:
     with codecs.open(files, mode='r', encoding='utf-8') as json_file:
         change = False
         Explain = False
         try:
-            djson = json.load(json_file, object_pairs_hook=OrderedDict)
+            with _stats.phase("parse"):
+                djson = _jsonio.load(json_file)
             for entry in djson:
                 if "tr_explain" in entry:
                     Explain = True
@@ -189,7 +158,7 @@ for files in json_files:
                     os.path.splitext(os.path.basename(files))[0]))
                 if Explain:
                     djson = [
-                        OrderedDict([
+                        dict([
                             ('assign', e["assign"]),
                             ('jp_text', e["jp_text"]),
                             ('tr_text', TR_name[e["jp_text"]]),
@@ -201,7 +170,7 @@ for files in json_files:
                     ]
                 else:
                     djson = [
-                        OrderedDict(
+                        dict(
                             [
                                 ('assign', e["assign"]),
                                 ('jp_text', e["jp_text"]),
@@ -210,13 +179,8 @@ for files in json_files:
                         )
                         for e in djson
                     ]
-                with codecs.open(
-                    files, mode='w+', encoding='utf-8'
-                ) as json_file:
-                    json.dump(
-                        djson, json_file, ensure_ascii=False,
-                        indent="\t", sort_keys=False)
-                    json_file.write("\n")
+                with _stats.phase("write"):
+                    _jsonio.write(files, djson)
         except ValueError as e:
             counterr += 1
             print("%s: %s" % (files, e))
@@ -243,7 +207,7 @@ for e in others:
     if e not in JP_explain:
         JP_explain[e] = ""
     ojson += [
-        OrderedDict(
+        dict(
             [
                 ('jp_text', e),
                 ('tr_text', TR_name[e]),
@@ -254,10 +218,8 @@ for e in others:
         )
     ]
 
-with codecs.open(os.path.join(dir, "Items_Leftovers.txt"), mode='w+', encoding='utf-8') as json_file:
-    json.dump(
-        ojson, json_file, ensure_ascii=False, indent="\t", sort_keys=False)
-    json_file.write("\n")
+with _stats.phase("write"):
+    _jsonio.write(os.path.join(dir, "Items_Leftovers.txt"), ojson)
     print("Left with {} leftover items".format(len(ojson)))
 
 if counterr > 0:
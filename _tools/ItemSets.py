@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 # coding=utf8
 import codecs
-import json
 import os
 import regex
 import argparse
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _jsonio  # noqa: E402
+import _stats  # noqa: E402
 
 json_loc = os.path.join("..", "json")
 
@@ -65,7 +69,8 @@ for items_file_name in items_file_names:
         print("\t{0} not found.".format(items_file_name))
         continue
 
-    items = json.load(items_file)
+    with _stats.phase("parse"):
+        items = _jsonio.load(items_file)
     print("{0} loaded.".format(items_file_name))
 
     items_file.close()
@@ -223,7 +228,8 @@ except FileNotFoundError:
     print("\t{0} not found.".format(items_file_name))
     quit()
     
-sets = json.load(sets_file)
+with _stats.phase("parse"):
+    sets = _jsonio.load(sets_file)
 print("{0} loaded.".format(sets_file_name) + " {")
 
 sets_file.close()
@@ -241,8 +247,5 @@ if newtranslations == False:
 
 print("}")
 
-sets_file = codecs.open(os.path.join(json_loc, sets_file_name),
-                         mode = 'w', encoding = 'utf-8')
-json.dump(sets, sets_file, ensure_ascii=False, indent="\t", sort_keys=False)
-sets_file.write("\n")
-sets_file.close()
+with _stats.phase("write"):
+    _jsonio.write(os.path.join(json_loc, sets_file_name), sets)
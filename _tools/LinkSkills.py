@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 # coding=utf8
 import codecs
-import json
 import os
 import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _glossary  # noqa: E402
+import _jsonio  # noqa: E402
+import _stats  # noqa: E402
 
 json_loc = os.path.join("..", "json")
 
@@ -14,7 +19,8 @@ try:
                              mode = 'r', encoding = 'utf-8')
 except FileNotFoundError:
     print("\t{0} not found.".format(skills_file_name))
-skills = json.load(skills_file)
+with _stats.phase("parse"):
+    skills = _jsonio.load(skills_file)
 print("{0} loaded.".format(skills_file_name))
 skills_file.close()
 
@@ -161,6 +167,9 @@ skill_effects = { # dictionary of lambdas because there's no such thing as switc
                                                           "% HP.\\nHP threshold decreases as ability level increases.")
     }
 
+# The element names are in _py/glossary.json
+elements = _glossary.terms("element")
+
 unknowns = []
 
 for skill in skills:
@@ -179,19 +188,12 @@ for skill in skills:
 
         if skill["tr_explainShort"] in skill_effects:
             # elements are used in multiple skill types
-            skill_text = skill_text.replace("炎属性", "Fire Element")
-            skill_text = skill_text.replace("氷属性", "Ice Element")
-            skill_text = skill_text.replace("雷属性", "Lightning Element")
-            skill_text = skill_text.replace("風属性", "Wind Element")
-            skill_text = skill_text.replace("光属性", "Light Element")
-            skill_text = skill_text.replace("闇属性", "Dark Element")
+            for jp, en in elements.items():
+                skill_text = skill_text.replace(jp, en)
             # translation depends on skill type, so:
             skill_text = skill_effects[skill["tr_explainShort"]](skill_text)
             skill["tr_explainLong"] = skill_text
 
 # write JSON back to file
-skills_file = codecs.open(os.path.join(json_loc, skills_file_name),
-                          mode = 'w', encoding = 'utf-8')
-json.dump(skills, skills_file, ensure_ascii=False, indent="\t", sort_keys=False)
-skills_file.write("\n")
-skills_file.close()
+with _stats.phase("write"):
+    _jsonio.write(os.path.join(json_loc, skills_file_name), skills)
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 # coding=utf8
 import codecs
-import json
 import os
 import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _glossary  # noqa: E402
+import _jsonio  # noqa: E402
+import _stats  # noqa: E402
 
 json_loc = os.path.join("..", "json")
 
@@ -16,20 +21,17 @@ try:
                              mode = 'r', encoding = 'utf-8')
 except FileNotFoundError:
     print("\t{0} not found.".format(tokens_file_name))
-tokens = json.load(tokens_file)
+with _stats.phase("parse"):
+    tokens = _jsonio.load(tokens_file)
 print("{0} loaded.".format(tokens_file_name))
 tokens_file.close()
 
-token_dict = {
-    "炎属性": "Fire Element",
-    "氷属性": "Ice Element",
-    "風属性": "Wind Element",
-    "雷属性": "Lightning Element",
-    "光属性": "Light Element",
-    "闇属性": "Dark Element",
+# The element names are in _py/glossary.json
+token_dict = _glossary.terms("element")
+token_dict.update({
     "攻撃ヒット時": "landing an attack",
     "ＪＡ成功時もしくはスライド操作時": "successful JA or Slide Action"
-    }
+    })
 
 numtable = "".maketrans("０１２３４５６７８９％", "0123456789%")
 
@@ -40,9 +42,6 @@ for token in tokens:
         token["tr_token"] = token["jp_token"].translate(numtable)
 
 # write JSON back to files
-tokens_file = codecs.open(os.path.join(json_loc, tokens_file_name),
-                          mode = 'w', encoding = 'utf-8')
-json.dump(tokens, tokens_file, ensure_ascii=False, indent="\t", sort_keys=False)
-tokens_file.write("\n")
-tokens_file.close()
+with _stats.phase("write"):
+    _jsonio.write(os.path.join(json_loc, tokens_file_name), tokens)
 
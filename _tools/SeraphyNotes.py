@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 # coding=utf8
 import codecs
-import json
 import os
 import shutil
 import sys
 import getopt
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _jsonio  # noqa: E402
+import _stats  # noqa: E402
+
 json_loc = os.path.join("..", "json")
 
 # load JSON from file
@@ -16,7 +19,8 @@ try:
                              mode = 'r', encoding = 'utf-8')
 except FileNotFoundError:
     print("\t{0} not found.".format(notes_file_name))
-notes = json.load(notes_file)
+with _stats.phase("parse"):
+    notes = _jsonio.load(notes_file)
 print("{0} loaded.".format(notes_file_name))
 notes_file.close()
 
@@ -233,11 +237,8 @@ for note in notes:
                 unknowns.update({note["jp_text"]: 1})
 
 # write JSON back to file
-notes_file = codecs.open(os.path.join(json_loc, notes_file_name),
-                          mode = 'w', encoding = 'utf-8')
-json.dump(notes, notes_file, ensure_ascii=False, indent="\t", sort_keys=False)
-notes_file.write("\n")
-notes_file.close()
+with _stats.phase("write"):
+    _jsonio.write(os.path.join(json_loc, notes_file_name), notes)
 
 sorted_unknowns = {}
 
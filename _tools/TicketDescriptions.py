@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 # coding=utf8
 import codecs
-import json
 import os
 import regex
 import shutil
 import argparse
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _jsonio  # noqa: E402
+import _stats  # noqa: E402
 
 json_loc = os.path.join("..", "json")
 
@@ -168,7 +172,8 @@ for name in layered_file_names:
         print("\t{0} not found.".format(items_file_name))
         continue
     
-    items = json.load(items_file)
+    with _stats.phase("parse"):
+        items = _jsonio.load(items_file)
     print("{0} loaded.".format(items_file_name) + " {")
     
     items_file.close()
@@ -187,11 +192,8 @@ for name in layered_file_names:
     
     print("}")
     
-    items_file = codecs.open(os.path.join(json_loc, items_file_name),
-                             mode = 'w', encoding = 'utf-8')
-    json.dump(items, items_file, ensure_ascii=False, indent="\t", sort_keys=False)
-    items_file.write("\n")
-    items_file.close()
+    with _stats.phase("write"):
+        _jsonio.write(os.path.join(json_loc, items_file_name), items)
 
 # Translate other cosmetics
 
@@ -340,7 +342,8 @@ for file_name in cosmetic_file_names:
         print("\t{0} not found.".format(items_file_name))
         continue
     
-    items = json.load(items_file)
+    with _stats.phase("parse"):
+        items = _jsonio.load(items_file)
     print("{0} loaded.".format(items_file_name) + " {")
     
     items_file.close()
@@ -359,11 +362,8 @@ for file_name in cosmetic_file_names:
     
     print("}")
 
-    items_file = codecs.open(os.path.join(json_loc, items_file_name),
-                             mode = 'w', encoding = 'utf-8')
-    json.dump(items, items_file, ensure_ascii=False, indent="\t", sort_keys=False)
-    items_file.write("\n")
-    items_file.close()
+    with _stats.phase("write"):
+        _jsonio.write(os.path.join(json_loc, items_file_name), items)
 
 # Translate LAs
 try:
@@ -372,7 +372,8 @@ try:
 except FileNotFoundError:
     print("\tItem_Stack_LobbyAction.txt not found.")
 
-items = json.load(items_file)
+with _stats.phase("parse"):
+    items = _jsonio.load(items_file)
 print("Item_Stack_LobbyAction.txt loaded. {")
 
 items_file.close()
@@ -493,11 +494,8 @@ if newtranslations == False:
 
 print("}")       
 
-items_file = codecs.open(os.path.join(json_loc, "Item_Stack_LobbyAction.txt"),
-                         mode = 'w', encoding = 'utf-8')
-json.dump(items, items_file, ensure_ascii=False, indent="\t", sort_keys=False)
-items_file.write("\n")
-items_file.close()
+with _stats.phase("write"):
+    _jsonio.write(os.path.join(json_loc, "Item_Stack_LobbyAction.txt"), items)
 
 # Translate voices
 
@@ -507,7 +505,8 @@ try:
 except FileNotFoundError:
     print("\tItem_Stack_Voice.txt not found.")
 
-items = json.load(items_file)
+with _stats.phase("parse"):
+    items = _jsonio.load(items_file)
 print("Item_Stack_Voice.txt loaded. {")
     
 items_file.close()
@@ -788,10 +787,7 @@ if newtranslations == False:
 
 print("}")       
 
-items_file = codecs.open(os.path.join(json_loc, "Item_Stack_Voice.txt"),
-                         mode = 'w', encoding = 'utf-8')
-json.dump(items, items_file, ensure_ascii=False, indent="\t", sort_keys=False)
-items_file.write("\n")
-items_file.close()
+with _stats.phase("write"):
+    _jsonio.write(os.path.join(json_loc, "Item_Stack_Voice.txt"), items)
 
 print ("Ticket translation complete.")
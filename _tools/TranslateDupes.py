@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 # coding=utf8
 import codecs
-from collections import OrderedDict
-import fnmatch
-import json
 import os
 import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _jsonio  # noqa: E402
+import _manifest  # noqa: E402
+import _stats  # noqa: E402
 
 json_loc = os.path.join("..", "json")
 
-file_names = fnmatch.filter(os.listdir(json_loc), 'Item_Stack_*.txt')
-file_names += fnmatch.filter(os.listdir(json_loc), 'Item_*Wear_*.txt')
+file_names = [os.path.basename(f) for f in _manifest.files(json_loc, "item_dupes")]
 
 for file_name in file_names:
     try:
@@ -20,7 +22,8 @@ for file_name in file_names:
         print("\t{0} not found.".format(file_name))
         continue
     
-    items = json.load(items_file)
+    with _stats.phase("parse"):
+        items = _jsonio.load(items_file)
     print("{0} loaded.".format(file_name))
     items_file.close()
 
@@ -37,8 +40,5 @@ for file_name in file_names:
 
     print("\t{0} duplicate item names translated.".format(dupes))
     
-    items_file = codecs.open(os.path.join(json_loc, file_name),
-                             mode = 'w', encoding = 'utf-8')
-    json.dump(items, items_file, ensure_ascii=False, indent="\t", sort_keys=False)
-    items_file.write("\n")
-    items_file.close()
+    with _stats.phase("write"):
+        _jsonio.write(os.path.join(json_loc, file_name), items)
@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import codecs
-from collections import OrderedDict
-import fnmatch
-import json
 import os
 import sys
 import unicodedata
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _jsonio  # noqa: E402
+import _manifest  # noqa: E402
+import _stats  # noqa: E402
+
 quick = {
     "*": "＊",  # Undo normalize of Asterisk
     "¥": "￥",  # Undo normalize of Yen
@@ -18,46 +20,6 @@ quick = {
     "\0": "\0"
 }
 
-# error counter
-counterr = 0
-
-# Need the json path
-if len(sys.argv) < 2:
-    dir = "json"
-else:
-    dir = sys.argv[1]
-
-# collect all the JSON files
-json_files = [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, '*.txt')
-]
-
-blacklist_files = [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'UI_Text.txt')
-]
-
-blacklist_files += [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'Name_Quest_AreaName.txt')
-]
-
-blacklist_files += [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'ChipExplain_ActiveExplain.txt')
-]
-
-blacklist_files += [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, 'ChipExplain_SupportExplain.txt')
-]
-
 bl = {"!", "＊", "†", "-", "士", "1", "2", "3", "4", "5"}
 
 
@@ -102,56 +64,75 @@ def normalizet(nk='NFKC', w=None):
     return g
 
 
-for filename in json_files:
+def normalize(filename, djson, nk='NFKC'):
+    """Normalize the translations of a file in place, True if any changed."""
     update = False
-    nk = 'NFKC'
-    if filename in blacklist_files:
-        nk = 'NFC'
-    with codecs.open(filename, mode='r', encoding='utf-8') as json_file:
-        djson = json.load(json_file, object_pairs_hook=OrderedDict)
-        for entry in djson:
-            for data in entry:
-                if data.startswith('tr_'):
-                    tl = data
-                    jl = tl.replace("tr_", "jp_")
-                    t = entry[tl]
-                    if jl not in entry:
-                        # We don't have JP explanations for titles, so don't report it
-                        if filename.endswith("Title_All.txt") and jl == "jp_explain": continue
-                        print("Missing {} in {}".format(jl, filename))
-                        print(json.dumps(entry, ensure_ascii=False, indent="\t"))
-                        continue
-                    j = entry[jl]
-                    if t == j:
-                        continue
-                    if t is None:
+    for entry in djson:
+        for data in entry:
+            if data.startswith('tr_'):
+                tl = data
+                jl = tl.replace("tr_", "jp_")
+                t = entry[tl]
+                if jl not in entry:
+                    # We don't have JP explanations for titles, so don't report it
+                    if filename.endswith("Title_All.txt") and jl == "jp_explain": continue
+                    print("Missing {} in {}".format(jl, filename))
+                    print(_jsonio.dumps(entry))
+                    continue
+                j = entry[jl]
+                if t == j:
+                    continue
+                if t is None:
+                    continue
+                if t == "":
+                    continue
+                if type(j) is str:
+                    w = {t}
+                else:
+                    w = t
+                n = normalizet(nk, w)
+                if type(j) is str:
+                    if n[0] == t:
                         continue
-                    if t == "":
-                        continue
-                    if type(j) is str:
-                        w = {t}
-                    else:
-                        w = t
-                    n = normalizet(nk, w)
-                    if type(j) is str:
-                        if n[0] == t:
-                            continue
-                    elif n == t:
-                        continue
-                    update = True
-                    if len(n) == 1:
-                        entry[tl] = n[0]
-                    else:
-                        entry[tl] = n
-
-    if (update):
-        counterr += 1
-        print("Updating {}".format(filename))
-        with codecs.open(filename, mode='w+', encoding='utf-8') as json_file:
-            json.dump(
-                djson, json_file, ensure_ascii=False,
-                indent="\t", sort_keys=False)
-            json_file.write("\n")
-
-if counterr > 0:
-    sys.exit("Issues found")
+                elif n == t:
+                    continue
+                update = True
+                if len(n) == 1:
+                    entry[tl] = n[0]
+                else:
+                    entry[tl] = n
+    return update
+
+
+if __name__ == '__main__':
+    # error counter
+    counterr = 0
+
+    # Need the json path
+    if len(sys.argv) < 2:
+        dir = "json"
+    else:
+        dir = sys.argv[1]
+
+    # collect all the JSON files
+    json_files = _manifest.files(dir, "json")
+
+    blacklist_files = _manifest.scan(dir)["nfc"]
+
+    for filename in json_files:
+        nk = 'NFKC'
+        if filename in blacklist_files:
+            nk = 'NFC'
+        with codecs.open(filename, mode='r', encoding='utf-8') as json_file:
+            with _stats.phase("parse"):
+                djson = _jsonio.load(json_file)
+        update = normalize(filename, djson, nk)
+
+        if (update):
+            counterr += 1
+            print("Updating {}".format(filename))
+            with _stats.phase("write"):
+                _jsonio.write(filename, djson)
+
+    if counterr > 0:
+        sys.exit("Issues found")
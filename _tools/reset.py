@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import codecs
-from collections import OrderedDict
-import fnmatch
-import json
 import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "_py"))
+import _jsonio  # noqa: E402
+import _manifest  # noqa: E402
+import _stats  # noqa: E402
+
 # error counter
 counterr = 0
 
@@ -17,18 +19,15 @@ else:
     dir = sys.argv[1]
 
 # collect all the JSON files
-json_files = [
-    os.path.join(dirpath, f)
-    for dirpath, dirnames, files in os.walk(dir)
-    for f in fnmatch.filter(files, '*.txt')
-]
+json_files = _manifest.files(dir, "json")
 
 for files in json_files:
     update = False
     f = os.path.splitext(os.path.basename(files))[0]
     with codecs.open(files, mode='r', encoding='utf-8') as json_file:
         print("Opening {}".format(files))
-        djson = json.load(json_file, object_pairs_hook=OrderedDict)
+        with _stats.phase("parse"):
+            djson = _jsonio.load(json_file)
         for entry in djson:
             for data in entry:
                 if data.startswith('tr_'):
@@ -46,11 +45,8 @@ for files in json_files:
 
     if (update):
         print("Updating {}".format(files))
-        with codecs.open(files, mode='w+', encoding='utf-8') as json_file:
-            json.dump(
-                djson, json_file, ensure_ascii=False,
-                indent="\t", sort_keys=False)
-            json_file.write("\n")
+        with _stats.phase("write"):
+            _jsonio.write(files, djson)
 
 if counterr > 0:
     sys.exit("Issues found")